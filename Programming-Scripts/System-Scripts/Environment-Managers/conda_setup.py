@@ -16,16 +16,17 @@ It includes enhanced color support, better terminal compatibility, and improved
 import os
 import sys
 import subprocess
-import shutil
 import time
 import logging
+import logging.handlers
+import atexit
 import json
-import argparse
+import types
 import platform
+import functools
+import re
 from pathlib import Path
-from colorama import init, Fore, Style, Back
-from tqdm import tqdm
-import getpass
+import threading
 
 # Platform-specific settings
 PLATFORM = platform.system().lower()
@@ -36,25 +37,32 @@ IS_LINUX = PLATFORM == 'linux'
 # Get user home directory in a cross-platform way
 HOME_DIR = str(Path.home())
 
+# Terminal facts used to decide on colors, read once at startup
+_IS_TTY = sys.stdout.isatty()
+_TERM = os.environ.get('TERM', '')
+_COLORTERM = os.environ.get('COLORTERM', '')
+_COLOR_TERMS = frozenset(('truecolor', '24bit', 'yes', 'true', '1'))
+_NO_COLOR = '--no-color' in sys.argv or bool(os.environ.get('NO_COLOR'))
+
 def setup_colors():
     """Configure color support based on platform and environment."""
-    # Check if we should disable colors
-    if '--no-color' in sys.argv or os.environ.get('NO_COLOR'):
-        init(strip=True)
+    # Check if we should disable colors. With colors off every color constant
+    # is an empty string, so colorama is never imported or initialised.
+    if _NO_COLOR:
+        return False
+    
+    # Verify color support
+    if not verify_color_support():
         return False
     
     # Windows needs convert=True, others don't
+    from colorama import init
     init(
         autoreset=True,
         strip=IS_WINDOWS,
         convert=IS_WINDOWS
     )
     
-    # Verify color support
-    if not verify_color_support():
-        init(strip=True)
-        return False
-    
     return True
 
 def verify_color_support():
@@ -63,17 +71,14 @@ def verify_color_support():
         return True
     
     # Unix-like systems
-    return (
-        sys.stdout.isatty() and
-        os.environ.get('TERM') != 'dumb' and
-        os.environ.get('COLORTERM', '') in ('truecolor', '24bit', 'yes', 'true', '1')
-    )
+    return _IS_TTY and _TERM != 'dumb' and _COLORTERM in _COLOR_TERMS
 
 # Initialize colors
 COLORS_ENABLED = setup_colors()
 
 # Enhanced color constants with fallbacks
 if COLORS_ENABLED:
+    from colorama import Fore, Style, Back
     CYAN = Fore.CYAN
     GREEN = Fore.GREEN + Style.BRIGHT
     YELLOW = Fore.YELLOW
@@ -101,6 +106,8 @@ else:
 
 def request_sudo_password():
     """Request sudo password at the start of the script."""
+    if os.geteuid() == 0:  # Already root, nothing to ask for
+        return
     print()
     print(f"{WARNING_BG} Sudo Access Required {RESET}")
     print()
@@ -113,48 +120,57 @@ def request_sudo_password():
     print(f"{YELLOW}You can disable this prompt using --sudo-off{RESET}\n")
     # if config['sudo_off']:
     #     return
-    if os.geteuid() != 0:  # Check if not running as root
-        print(f"{YELLOW}This script requires sudo privileges.{RESET}")
-        try:
-            password = getpass.getpass(f"{CYAN}Enter sudo password: {RESET}")
-            cmd = ['sudo', '-S', 'echo', 'Sudo access granted']
-            result = subprocess.run(cmd, input=f"{password}\n", text=True, capture_output=True)
-            if result.returncode != 0:
-                print(f"{RED}Invalid sudo password. Exiting.{RESET}")
-                sys.exit(1)
-            os.environ['SUDO_ASKPASS'] = '/bin/echo'
-        except Exception as e:
-            print(f"{RED}Failed to get sudo access: {e}{RESET}")
+    print(f"{YELLOW}This script requires sudo privileges.{RESET}")
+    try:
+        import getpass  # Only needed when we actually prompt
+        password = getpass.getpass(f"{CYAN}Enter sudo password: {RESET}")
+        # -v validates the password and caches sudo's timestamp, so later
+        # `sudo -n` checks succeed without asking again
+        cmd = ['sudo', '-S', '-v']
+        result = subprocess.run(cmd, input=f"{password}\n", text=True, capture_output=True)
+        if result.returncode != 0:
+            print(f"{RED}Invalid sudo password. Exiting.{RESET}")
             sys.exit(1)
+    except Exception as e:
+        print(f"{RED}Failed to get sudo access: {e}{RESET}")
+        sys.exit(1)
+
+# Arguments that only read state and never need sudo
+_READ_ONLY_ARGS = frozenset((
+    '--list', '--help', '-h', '--no-color', '--info', '--detect', '--packages', '--search', '--bunny'
+))
 
 def needs_sudo():
     """Check if the current command needs sudo access."""
-    read_only_args = ['--list', '--help', '-h', '--no-color', '--info', '--detect', '--packages', '--search', '--bunny']
-    for arg in sys.argv[1:]:
-        if arg in read_only_args:
-            return False
-    return True
+    return _READ_ONLY_ARGS.isdisjoint(sys.argv[1:])
 
-if not platform.system().lower() == 'windows' and needs_sudo():  # Only on Unix-like systems
+if not IS_WINDOWS and needs_sudo():  # Only on Unix-like systems
     request_sudo_password()
 
 
+# Colored prefixes for the print helpers, built once instead of on every call
+_OK = f"\n{GREEN}✓ "
+_ERR = f"\n{RED}✗ "
+_WARN = f"\n{YELLOW}! "
+_INFO = f"{BLUE}→ "
+_END = f"{RESET}\n"
+
 # Define print functions early to avoid reference errors
 def print_success(message):
     """Print a success message with a checkmark."""
-    print(f"\n{GREEN}✓ {message}{RESET}")
+    sys.stdout.write(f"{_OK}{message}{_END}")
 
 def print_error(message):
     """Print an error message with an X."""
-    print(f"\n{RED}✗ {message}{RESET}")
+    sys.stdout.write(f"{_ERR}{message}{_END}")
 
 def print_warning(message):
     """Print a warning message with an exclamation mark."""
-    print(f"\n{YELLOW}! {message}{RESET}")
+    sys.stdout.write(f"{_WARN}{message}{_END}")
 
 def print_info(message):
     """Print an info message with an arrow."""
-    print(f"{BLUE}→ {message}{RESET}")
+    sys.stdout.write(f"{_INFO}{message}{_END}")
 
 # Configuration and Logging Setup
 LOG_DIR = '/Users/ranger/.db/logs'
@@ -165,40 +181,63 @@ elif not os.access(LOG_DIR, os.W_OK):
     print_warning(f"No write permission for {LOG_DIR}. Files will be saved in the script's folder.")
     LOG_DIR = os.getcwd()
 
-# Setup logging first
+# Setup logging first. INFO records are buffered in memory and written in
+# batches; anything at ERROR or above flushes the buffer straight away.
 LOG_FILE = os.path.join(LOG_DIR, 'conda_manager.log')
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+_log_file_handler = logging.FileHandler(LOG_FILE)
+_log_file_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
+))
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=64,
+    flushLevel=logging.ERROR,
+    target=_log_file_handler
 )
+logging.getLogger().addHandler(_log_buffer)
+logging.getLogger().setLevel(logging.INFO)
+atexit.register(_log_buffer.flush)
 
 # Configuration file setup
 CONFIG_DIR = os.path.join("/Users/ranger/.db/configs")
 CONFIG_FILE = os.path.join(CONFIG_DIR, 'conda_manager_config.json')
 DEFAULT_CONFIG = {
     'python_version': '3.9',
-    'show_animations': True,
+    'show_animations': False,
     'confirm_deletions': True,
     'export_format': 'yaml',
     'theme': 'default'
 }
 
+# JSON text of the config as it is on disk; save_config() skips the write
+# when nothing has changed since the load or the last save
+_saved_config = {'text': None}
+
+def _config_text(config):
+    return json.dumps(config, indent=4)
+
+@functools.lru_cache(maxsize=1)
 def load_config():
+    """Read the config file once; later calls share the same dict."""
     try:
         if os.path.exists(CONFIG_FILE):
             with open(CONFIG_FILE, 'r') as f:
-                return {**DEFAULT_CONFIG, **json.load(f)}
-        return DEFAULT_CONFIG
+                loaded = {**DEFAULT_CONFIG, **json.load(f)}
+            _saved_config['text'] = _config_text(loaded)
+            return loaded
+        return dict(DEFAULT_CONFIG)
     except Exception as e:
         logging.error(f"Error loading config: {e}")
-        return DEFAULT_CONFIG
+        return dict(DEFAULT_CONFIG)
 
 def save_config(config):
+    text = _config_text(config)
+    if text == _saved_config['text']:
+        return True  # Unchanged, nothing to write
     try:
         with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+            f.write(text)
+        _saved_config['text'] = text
         return True
     except Exception as e:
         logging.error(f"Error saving config: {e}")
@@ -207,60 +246,136 @@ def save_config(config):
 config = load_config()
 
 
-def show_spinner(seconds, text="Processing"):
-    """Show a spinning cursor while processing."""
-    spinners = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-    for _ in range(int(seconds * 10)):
-        for spinner in spinners:
-            sys.stdout.write(f'\r{CYAN}{spinner} {text}...{RESET}')
-            sys.stdout.flush()
-            time.sleep(0.1)
-    sys.stdout.write('\r' + ' ' * (len(text) + 15) + '\r')
+# Spinner frames are pre-colored and pre-encoded once; only the label varies per call
+SPINNER_CHARS = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+_SPINNER_FRAMES = tuple(f'\r{CYAN}{s} '.encode() for s in SPINNER_CHARS)
+
+def _stdout_buffer():
+    """Return the raw byte stream behind stdout, or None if text must go through colorama."""
+    if IS_WINDOWS:
+        return None
+    return getattr(sys.stdout, 'buffer', None)
+
+def _spin_until(stop, text, seconds=None):
+    """Animate the spinner until `stop` is set (or `seconds` pass), then clear it."""
+    suffix = f'{text}...{RESET}'
+    blank = '\r' + ' ' * (len(text) + 15) + '\r'
+    buf = _stdout_buffer()
     sys.stdout.flush()
 
-def show_progress(task_name, steps=50):
-    """Show a progress bar with customized styling."""
+    if buf is None:
+        frames = [frame.decode() + suffix for frame in _SPINNER_FRAMES]
+        out = sys.stdout
+    else:
+        # One pre-built write per frame instead of format + write + flush
+        suffix = suffix.encode()
+        frames = [frame + suffix for frame in _SPINNER_FRAMES]
+        blank = blank.encode()
+        out = buf
+
+    deadline = None if seconds is None else time.monotonic() + seconds
+    i = 0
+    while deadline is None or time.monotonic() < deadline:
+        out.write(frames[i % len(frames)])
+        out.flush()
+        i += 1
+        if stop.wait(0.1):
+            break
+    out.write(blank)
+    out.flush()
+
+def animations_enabled():
+    """Spinners are cosmetic: only drawn on a terminal with animations on."""
+    return _IS_TTY and config.get('show_animations')
+
+def show_spinner(seconds, text="Processing"):
+    """Show a spinning cursor for `seconds`, when animations are enabled."""
+    if not animations_enabled():
+        return
+    _spin_until(threading.Event(), text, seconds)
+
+def with_spinner(text, fn, *args, **kwargs):
+    """Call fn(*args, **kwargs) with a spinner running until it returns."""
+    if not animations_enabled():
+        return fn(*args, **kwargs)
+    stop = threading.Event()
+    spinner = threading.Thread(target=_spin_until, args=(stop, text), daemon=True)
+    spinner.start()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        stop.set()
+        spinner.join()
+
+def run_with_progress(cmd, task_name):
+    """Run a command, showing its live output on a progress bar; returns the output."""
+    from tqdm import tqdm  # Only needed once a long-running command starts
     print(f"\n{CYAN}⚡ {task_name}...{RESET}")
-    for _ in tqdm(range(steps), 
-                 desc=f"{WHITE}{task_name}{RESET}",
-                 bar_format='{l_bar}{bar:30}{r_bar}',
-                 colour='green'):
-        time.sleep(0.02)
+    output = []
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as proc:
+        with tqdm(desc=f"{WHITE}{task_name}{RESET}",
+                  bar_format='{desc}: {elapsed}{postfix}',
+                  colour='green') as pbar:
+            for line in proc.stdout:
+                output.append(line)
+                line = line.strip()
+                if line:
+                    pbar.set_postfix_str(line[:40])
     print()
+    output = ''.join(output)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=output)
+    return output
 
 
 def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
+# Header box and static system info, built once. Color is only switched where
+# it actually changes and reset once at the end of each block.
+_HEADER = (
+    f"{MAGENTA}╔══════════════════════════════════════════════╗\n"
+    f"║{HEADER_BG}        Conda Environment Manager             {RESET}{MAGENTA}║\n"
+    f"║{WHITE}                Version 5.6                   {RESET}{MAGENTA}║\n"
+    f"╚══════════════════════════════════════════════╝{RESET}\n"
+    f"{MENU_HEADER} System Information {RESET}\n"
+    f"{BLUE}OS:     {WHITE}{platform.system()} {platform.release()}\n"
+    f"{BLUE}Python: {WHITE}{sys.version.split()[0]}\n"
+    f"{BLUE}Conda:  {WHITE}"
+)
+
 def print_header():
     """Print a beautiful header with version and additional info."""
     clear_screen()
-    print(f"{MAGENTA}╔══════════════════════════════════════════════╗{RESET}")
-    print(f"{MAGENTA}║{HEADER_BG}        Conda Environment Manager             {RESET}{MAGENTA}║{RESET}")
-    print(f"{MAGENTA}║{WHITE}                Version 5.6                   {RESET}{MAGENTA}║{RESET}")
-    print(f"{MAGENTA}╚══════════════════════════════════════════════╝{RESET}")
-    
-    print(f"{MENU_HEADER} System Information {RESET}")
-    print(f"{BLUE}OS:     {WHITE}{platform.system()} {platform.release()}{RESET}")
-    print(f"{BLUE}Python: {WHITE}{sys.version.split()[0]}{RESET}")
-    print(f"{BLUE}Conda:  {WHITE}{get_conda_version()}{RESET}")
+    sys.stdout.write(f"{_HEADER}{get_conda_version()}{RESET}\n")
     
     if check_admin_requirements():
         print(f"\n{WARNING_BG} Note: Some operations may require elevated privileges {RESET}")
     print()
 
+@functools.lru_cache(maxsize=1)
 def get_conda_version():
     """Get the installed Conda version."""
     try:
-        result = subprocess.run(['conda', '--version'], 
-                              capture_output=True, 
-                              text=True, 
-                              check=True)
-        return result.stdout.strip().split()[-1]
+        return _conda('--version').stdout.strip().split()[-1]
     except:
         return "Not found"
 
+# Input validators, compiled once at import
+ENV_NAME_RE = re.compile(r'^[A-Za-z0-9_.\-]{1,64}\Z')
+PYTHON_VERSION_RE = re.compile(r'^\d+(\.\d+){0,2}\Z')
+
+@functools.lru_cache(maxsize=8)
+def env_number_validator(count):
+    """Validator accepting the menu numbers 1..count of the listed environments.
+
+    Cached per count, so menu renders with an unchanged environment list
+    reuse the same set instead of rebuilding it for every prompt.
+    """
+    return frozenset(map(str, range(1, count + 1))).__contains__
+
 def get_valid_input(prompt, validator=None, error_msg=None):
     """Get validated input from the user."""
     while True:
@@ -273,36 +388,93 @@ def confirm_action(message="Are you sure?"):
     """Get confirmation from the user."""
     return input(f"{YELLOW}{message} (y/n): {RESET}").lower().startswith('y')
 
+# Tools that must be on PATH, with the command used to probe each
+REQUIREMENTS = (
+    ('conda', ('conda', '--version')),
+    ('pip', ('pip', '--version')),
+)
+
 def check_requirements():
     """Check if required tools are installed."""
-    requirements = {
-        'conda': ['conda', '--version'],
-        'pip': ['pip', '--version']
-    }
-    
-    for req, cmd in requirements.items():
-        try:
-            subprocess.run(cmd, capture_output=True, check=True)
-        except subprocess.CalledProcessError:
-            print_error(f"{req} is not installed or not found in PATH")
-            sys.exit(1)
+    from concurrent.futures import ThreadPoolExecutor
+    # The probes are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(REQUIREMENTS)) as executor:
+        probes = [
+            (req, executor.submit(subprocess.run, cmd, capture_output=True, check=True))
+            for req, cmd in REQUIREMENTS
+        ]
+        for req, probe in probes:
+            try:
+                probe.result()
+            except (subprocess.CalledProcessError, OSError):
+                print_error(f"{req} is not installed or not found in PATH")
+                sys.exit(1)
 
-def check_existing_envs():
+# Seconds a `conda env list` result is reused before conda is asked again.
+# The interactive menu allows a longer age: every create/delete/clone done
+# through this script clears the cache, so only outside changes can be missed.
+ENV_CACHE_TTL = 5
+MENU_ENV_CACHE_TTL = 60
+
+# Last environment listing and when it was read (time.monotonic())
+_envs_cache = {'ts': 0.0, 'value': None}
+
+def _conda(*args, **kwargs):
+    """Run conda directly (no shell) and return the finished process with its output captured."""
+    return subprocess.run(['conda', *args], capture_output=True, text=True, check=True, **kwargs)
+
+def _conda_json(*args):
+    """Run a conda command with --json and return the parsed output."""
+    return json.loads(_conda(*args, '--json').stdout)
+
+def _conda_root_prefix(env_list):
+    """Work out the base environment prefix from `conda env list --json` output."""
+    root = env_list.get('root_prefix') or os.environ.get('CONDA_ROOT')
+    if not root and os.environ.get('CONDA_EXE'):
+        # CONDA_EXE is <root>/bin/conda (or <root>\Scripts\conda.exe)
+        root = os.path.dirname(os.path.dirname(os.environ['CONDA_EXE']))
+    if not root:
+        # Older conda leaves root_prefix out of `env list`; `conda info` always has it
+        try:
+            root = _conda_json('info').get('root_prefix')
+        except (subprocess.CalledProcessError, ValueError):
+            pass
+    return root
+
+def _read_envs():
+    """Run `conda env list --json`; returns {name: path}."""
+    env_list = _conda_json('env', 'list')
+    root = _conda_root_prefix(env_list)
+    envs = {}
+    for path in env_list.get('envs', []):
+        if root and os.path.normpath(path) == os.path.normpath(root):
+            name = 'base'
+        elif os.path.basename(os.path.dirname(path)) == 'envs':
+            name = os.path.basename(path)
+        else:
+            name = path  # Unnamed environment outside the envs dirs
+        envs[name] = path
+    return envs
+
+def list_envs(max_age=ENV_CACHE_TTL):
+    """Get a {name: path} mapping of all conda environments, reusing one up to max_age seconds old."""
+    now = time.monotonic()
+    if _envs_cache['value'] is None or now - _envs_cache['ts'] >= max_age:
+        _envs_cache['value'] = _read_envs()
+        _envs_cache['ts'] = now
+    return _envs_cache['value']
+
+def invalidate_env_cache():
+    """Forget cached environment listings after an environment is added or removed."""
+    _envs_cache['value'] = None
+
+def check_existing_envs(max_age=ENV_CACHE_TTL):
     """Get list of existing Conda environments."""
     try:
-        result = subprocess.run(['conda', 'env', 'list'], 
-                              capture_output=True, 
-                              text=True, 
-                              check=True)
-        env_lines = result.stdout.splitlines()
-        envs = []
-        for line in env_lines:
-            if line and not line.startswith('#'):
-                env = line.split()[0]
-                if '*' not in line:
-                    envs.append(env)
-        return envs
-    except subprocess.CalledProcessError:
+        # The currently active environment is left out, as before
+        active = os.environ.get('CONDA_PREFIX')
+        return [name for name, path in list_envs(max_age).items() if path != active]
+    except (subprocess.CalledProcessError, ValueError):
         print_error("Could not retrieve Conda environments")
         return []
 
@@ -325,20 +497,20 @@ def create_environment():
     
     env_name = get_valid_input(
         "Enter environment name",
-        lambda x: x and x.isalnum(),
-        "Environment name must be alphanumeric"
+        ENV_NAME_RE.match,
+        "Environment name may only use letters, numbers, '_', '.' and '-'"
     )
     
     python_version = get_valid_input(
         f"Enter Python version (press Enter for {config['python_version']})",
-        lambda x: not x or x.count('.') <= 2,
+        lambda x: not x or PYTHON_VERSION_RE.match(x),
         "Invalid Python version format"
     ) or config['python_version']
     
     try:
-        show_progress("Creating environment")
         cmd = ['conda', 'create', '--name', env_name, f'python={python_version}', '-y']
-        subprocess.run(cmd, check=True, capture_output=True)
+        run_with_progress(cmd, "Creating environment")
+        invalidate_env_cache()
         print_success(f"Environment '{env_name}' created successfully!")
         show_activation_instructions(env_name)
         logging.info(f"Created environment: {env_name} with Python {python_version}")
@@ -354,12 +526,11 @@ def delete_environment(env_name):
         f"Are you sure you want to delete '{env_name}'?"
     ):
         try:
-            show_progress(f"Deleting environment '{env_name}'")
-            subprocess.run(
+            run_with_progress(
                 ['conda', 'env', 'remove', '--name', env_name, '-y'],
-                check=True,
-                capture_output=True
+                f"Deleting environment '{env_name}'"
             )
+            invalidate_env_cache()
             print_success(f"Environment '{env_name}' deleted successfully")
             logging.info(f"Deleted environment: {env_name}")
         except subprocess.CalledProcessError as e:
@@ -368,31 +539,47 @@ def delete_environment(env_name):
     else:
         print_warning("Deletion cancelled")
 
+_ACTIVATE_HEAD = f"\n{CYAN}To activate this environment, run:{RESET}\n{GREEN}conda activate "
+_ACTIVATE_TAIL = f"{RESET}\n{YELLOW}Note: Run this command in your terminal{RESET}\n"
+
 def show_activation_instructions(env_name):
     """Show how to activate an environment."""
-    cmd = f"conda activate {env_name}"
-    print(f"\n{CYAN}To activate this environment, run:{RESET}")
-    print(f"{GREEN}{cmd}{RESET}")
-    print(f"{YELLOW}Note: Run this command in your terminal{RESET}")
+    sys.stdout.write(f"{_ACTIVATE_HEAD}{env_name}{_ACTIVATE_TAIL}")
 
     # Check for dependency files in current directory
     check_and_offer_install(env_name)
 
+# Dependency files looked for in the current directory
+ENV_YML_NAMES = ('environment.yml', 'environment.yaml', 'conda.yml', 'conda.yaml')
+LOCAL_ENV_DIRS = ('conda_env', '.conda', 'env', '.env')
+
+@functools.lru_cache(maxsize=4)
+def _scan_cwd(cwd, mtime_ns):
+    """List a directory once; returns (all entry names, directory names)."""
+    names = set()
+    dirs = set()
+    with os.scandir(cwd) as entries:
+        for entry in entries:
+            names.add(entry.name)
+            if entry.is_dir():
+                dirs.add(entry.name)
+    return frozenset(names), frozenset(dirs)
+
+def scan_cwd():
+    """Get the entries of the current directory, re-listing only when it changes."""
+    cwd = os.getcwd()
+    try:
+        return _scan_cwd(cwd, os.stat(cwd).st_mtime_ns)
+    except OSError:
+        return frozenset(), frozenset()
+
 def check_and_offer_install(env_name):
     """Check for dependency files and offer to install them."""
-    cwd = os.getcwd()
+    names, _ = scan_cwd()
 
     # Check for various dependency files
-    env_yml = None
-    req_txt = None
-
-    for f in ['environment.yml', 'environment.yaml', 'conda.yml', 'conda.yaml']:
-        if os.path.exists(os.path.join(cwd, f)):
-            env_yml = f
-            break
-
-    if os.path.exists(os.path.join(cwd, 'requirements.txt')):
-        req_txt = 'requirements.txt'
+    env_yml = next((f for f in ENV_YML_NAMES if f in names), None)
+    req_txt = 'requirements.txt' if 'requirements.txt' in names else None
 
     if not env_yml and not req_txt:
         return
@@ -432,12 +619,10 @@ def check_and_offer_install(env_name):
 def install_from_env_yml(env_name, yml_file):
     """Install dependencies from environment.yml file."""
     try:
-        show_progress(f"Installing from {yml_file}")
         # Use conda env update to install into existing environment
-        subprocess.run(
+        run_with_progress(
             ['conda', 'env', 'update', '--name', env_name, '--file', yml_file, '--prune'],
-            check=True,
-            capture_output=True
+            f"Installing from {yml_file}"
         )
         print_success(f"Dependencies from {yml_file} installed successfully!")
         logging.info(f"Installed dependencies from {yml_file} into {env_name}")
@@ -448,11 +633,9 @@ def install_from_env_yml(env_name, yml_file):
 def install_from_requirements(env_name, req_file):
     """Install dependencies from requirements.txt file."""
     try:
-        show_progress(f"Installing from {req_file}")
-        subprocess.run(
+        run_with_progress(
             ['conda', 'run', '-n', env_name, 'pip', 'install', '-r', req_file],
-            check=True,
-            capture_output=True
+            f"Installing from {req_file}"
         )
         print_success(f"Dependencies from {req_file} installed successfully!")
         logging.info(f"Installed dependencies from {req_file} into {env_name}")
@@ -466,18 +649,56 @@ def show_deactivation_instructions():
     print(f"{GREEN}conda deactivate{RESET}")
     print(f"{YELLOW}Note: Run this command in your terminal when done{RESET}")
 
-def list_packages(env_name):
+# Complete `conda list` output per environment: {name: (change stamp, lines)}
+_conda_list_cache = {}
+
+def iter_conda_list(env_name, cache=True):
+    """Yield `conda list` lines for an environment as conda produces them.
+
+    A complete listing is kept and replayed until the environment's
+    conda-meta changes, so repeat listings and searches skip conda.
+    Pass cache=False for a one-off listing that will never be repeated.
+    """
+    cached = _conda_list_cache.get(env_name)
+    if cached and cached[0] == env_stamp(env_name):
+        yield from cached[1]
+        return
+
+    cmd = ['conda', 'list', '--name', env_name]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    finished = False
+    lines = []
+    try:
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            lines.append(line)
+            yield line
+        finished = True
+    finally:
+        proc.stdout.close()
+        if not finished:
+            proc.kill()  # Caller stopped early, no need for the rest
+        proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    if not cache:
+        return  # Stamping needs `conda env list`; not worth it for a single listing
+    # Stamped after the fact so the first line is never held up by `conda env list`
+    stamp = env_stamp(env_name)
+    if stamp is not None:
+        _conda_list_cache[env_name] = (stamp, tuple(lines))
+
+def list_packages(env_name, cache=True):
     """List all packages in an environment."""
     try:
-        show_spinner(1, "Retrieving package list")
-        result = subprocess.run(
-            ['conda', 'list', '--name', env_name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        # Spin only until conda produces its first line, then stream the rest
+        lines = iter_conda_list(env_name, cache)
+        first = with_spinner("Retrieving package list", next, lines, None)
         print(f"\n{CYAN}Packages in environment '{env_name}':{RESET}")
-        print(f"{WHITE}{result.stdout}{RESET}")
+        if first is not None:
+            print(f"{WHITE}{first}{RESET}")
+        for line in lines:
+            print(f"{WHITE}{line}{RESET}")
         logging.info(f"Listed packages for: {env_name}")
     except subprocess.CalledProcessError:
         print_error("Failed to list packages")
@@ -487,11 +708,9 @@ def export_environment(env_name):
     """Export environment configuration."""
     try:
         output_file = f"{env_name}_environment.yml"
-        show_progress("Exporting environment")
-        subprocess.run(
+        run_with_progress(
             ['conda', 'env', 'export', '--name', env_name, '--file', output_file],
-            check=True,
-            capture_output=True
+            "Exporting environment"
         )
         print_success(f"Environment exported to {output_file}")
         logging.info(f"Exported environment: {env_name}")
@@ -502,16 +721,12 @@ def export_environment(env_name):
 def export_requirements(env_name):
     """Export environment packages to requirements.txt with versions."""
     try:
-        show_progress("Exporting requirements")
+        print_info("Exporting requirements...")
         output_file = f"{env_name}_requirements.txt"
         
-        # Use pip list to get exact versions
-        result = subprocess.run(
-            ['conda', 'run', '-n', env_name, 'pip', 'freeze'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        # Use pip freeze to get exact versions (stdout is the file content,
+        # so it is captured on its own rather than through run_with_progress)
+        result = _conda('run', '-n', env_name, 'pip', 'freeze')
         
         with open(output_file, 'w') as f:
             f.write(result.stdout)
@@ -525,34 +740,38 @@ def export_requirements(env_name):
 def clone_environment(source_env, target_env):
     """Clone an existing environment."""
     try:
-        show_progress(f"Cloning environment '{source_env}' to '{target_env}'")
-        subprocess.run(
+        run_with_progress(
             ['conda', 'create', '--name', target_env, '--clone', source_env, '-y'],
-            check=True,
-            capture_output=True
+            f"Cloning environment '{source_env}' to '{target_env}'"
         )
+        invalidate_env_cache()
         print_success(f"Environment cloned successfully to '{target_env}'")
         logging.info(f"Cloned environment from {source_env} to {target_env}")
     except subprocess.CalledProcessError:
         print_error("Failed to clone environment")
         logging.error(f"Failed to clone from {source_env} to {target_env}")
 
-def check_admin_requirements():
-    """Check and explain admin requirements based on platform."""
+# shell32 is loaded once rather than on every admin check
+_SHELL32 = None
+if IS_WINDOWS:
+    try:
+        import ctypes
+        # Properly handle Windows-specific code to avoid Pylance errors
+        if hasattr(ctypes, 'windll'):  # type: ignore
+            _SHELL32 = ctypes.WinDLL('shell32')  # type: ignore
+    except Exception:
+        _SHELL32 = None
+
+@functools.lru_cache(maxsize=1)
+def _admin_status():
+    """Work out (admin_needed, explanation) once; it can't change while we run."""
     admin_needed = False
     explanation = ""
     
     if IS_WINDOWS:
         # Check if running with admin privileges
         try:
-            import ctypes
-            # Properly handle Windows-specific code to avoid Pylance errors
-            if IS_WINDOWS and hasattr(ctypes, 'windll'):  # type: ignore
-                # This code only runs on Windows
-                shell32 = ctypes.WinDLL('shell32')  # type: ignore
-                admin_needed = not shell32.IsUserAnAdmin()
-            else:
-                admin_needed = False
+            admin_needed = bool(_SHELL32) and not _SHELL32.IsUserAnAdmin()
             explanation = (
                 "Administrator privileges may be required on Windows to:\n"
                 "1. Install packages globally\n"
@@ -562,9 +781,11 @@ def check_admin_requirements():
         except Exception:
             admin_needed = False
     elif IS_LINUX or IS_MACOS:
-        # Check if user has sudo privileges
+        # Check if user has sudo privileges. `sudo -n -v` succeeds straight
+        # away on the ticket cached at startup and refreshes it as well.
         try:
-            subprocess.run(['sudo', '-n', 'true'], check=True, capture_output=True)
+            if subprocess.run(['sudo', '-n', '-v'], capture_output=True).returncode != 0:
+                subprocess.run(['sudo', '-n', 'true'], check=True, capture_output=True)
             admin_needed = False
         except:
             admin_needed = True
@@ -575,6 +796,12 @@ def check_admin_requirements():
                 "3. Update system Python installations"
             )
     
+    return admin_needed, explanation
+
+def check_admin_requirements():
+    """Check and explain admin requirements based on platform."""
+    admin_needed, explanation = _admin_status()
+    
     if admin_needed:
         print_warning(explanation)
         print_info("You can still use most features without privileges")
@@ -584,11 +811,9 @@ def check_admin_requirements():
 def update_environment(env_name):
     """Update all packages in an environment."""
     try:
-        show_progress(f"Updating packages in '{env_name}'")
-        subprocess.run(
+        run_with_progress(
             ['conda', 'update', '--name', env_name, '--all', '-y'],
-            check=True,
-            capture_output=True
+            f"Updating packages in '{env_name}'"
         )
         print_success(f"Environment '{env_name}' updated successfully")
         logging.info(f"Updated all packages in: {env_name}")
@@ -599,16 +824,15 @@ def update_environment(env_name):
 def install_package(env_name, package):
     """Install a new package in the environment."""
     try:
-        show_progress(f"Installing {package}")
         cmd = ['conda', 'install', '--name', env_name, package, '-y']
-        subprocess.run(cmd, check=True, capture_output=True)
+        run_with_progress(cmd, f"Installing {package}")
         print_success(f"Package '{package}' installed successfully")
         logging.info(f"Installed {package} in {env_name}")
     except subprocess.CalledProcessError:
         print_warning(f"Conda install failed, trying pip...")
         try:
             cmd = ['conda', 'run', '-n', env_name, 'pip', 'install', package]
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_with_progress(cmd, f"Installing {package} with pip")
             print_success(f"Package '{package}' installed successfully via pip")
             logging.info(f"Installed {package} via pip in {env_name}")
         except subprocess.CalledProcessError:
@@ -618,18 +842,15 @@ def install_package(env_name, package):
 def repair_environment(env_name):
     """Attempt to repair a broken environment."""
     try:
-        show_progress(f"Repairing environment '{env_name}'")
         # First, try to remove any broken packages
-        subprocess.run(
+        run_with_progress(
             ['conda', 'clean', '--all', '-y'],
-            check=True,
-            capture_output=True
+            "Cleaning conda caches"
         )
         # Then try to fix the environment
-        subprocess.run(
+        run_with_progress(
             ['conda', 'install', '--name', env_name, '--rev', '0'],
-            check=True,
-            capture_output=True
+            f"Repairing environment '{env_name}'"
         )
         print_success(f"Environment '{env_name}' repaired successfully")
         logging.info(f"Repaired environment: {env_name}")
@@ -640,20 +861,18 @@ def repair_environment(env_name):
 def detect_local_conda_env():
     """Auto-detect conda environment in current directory."""
     cwd = os.getcwd()
+    names, dirs = scan_cwd()
     detected = []
 
     # Check for conda environment files
-    env_files = ['environment.yml', 'environment.yaml', 'conda.yml', 'conda.yaml']
-    for env_file in env_files:
-        env_path = os.path.join(cwd, env_file)
-        if os.path.exists(env_path):
-            detected.append(('file', env_file, env_path))
+    for env_file in ENV_YML_NAMES:
+        if env_file in names:
+            detected.append(('file', env_file, os.path.join(cwd, env_file)))
 
     # Check for local conda env folders (rare but possible)
-    local_env_names = ['conda_env', '.conda', 'env', '.env']
-    for env_name in local_env_names:
-        env_path = os.path.join(cwd, env_name)
-        if os.path.isdir(env_path):
+    for env_name in LOCAL_ENV_DIRS:
+        if env_name in dirs:
+            env_path = os.path.join(cwd, env_name)
             # Check if it's a conda environment
             conda_meta = os.path.join(env_path, 'conda-meta')
             if os.path.isdir(conda_meta):
@@ -664,33 +883,67 @@ def detect_local_conda_env():
 def get_env_path(env_name):
     """Get the path to a conda environment."""
     try:
-        result = subprocess.run(
-            ['conda', 'env', 'list'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        for line in result.stdout.splitlines():
-            if line and not line.startswith('#'):
-                parts = line.split()
-                if len(parts) >= 2 and parts[0] == env_name:
-                    return parts[-1]  # Path is usually the last column
-        return None
-    except subprocess.CalledProcessError:
+        return list_envs().get(env_name)
+    except (subprocess.CalledProcessError, ValueError):
         return None
 
+def _scandir_size(path):
+    """Sum file sizes under path, reusing the stat data os.scandir already has."""
+    total_size = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total_size
+
+@functools.lru_cache(maxsize=32)
+def _env_size_bytes(env_path, mtime_ns):
+    """Total size of an environment; cached until its package set changes."""
+    if not IS_WINDOWS:
+        # du walks the tree natively, much faster than Python on large envs.
+        # It may exit non-zero on unreadable files but still prints a total.
+        try:
+            result = subprocess.run(['du', '-sk', env_path],
+                                  capture_output=True,
+                                  text=True,
+                                  timeout=30)
+            return int(result.stdout.split()[0]) * 1024
+        except (subprocess.SubprocessError, OSError, ValueError, IndexError):
+            pass
+    return _scandir_size(env_path)
+
+def _env_stamp(env_path):
+    """Change marker for an environment's contents.
+
+    conda-meta is rewritten on every install/remove, so its mtime tells us
+    when anything cached about the environment is stale.
+    """
+    conda_meta = os.path.join(env_path, 'conda-meta')
+    stamp_path = conda_meta if os.path.isdir(conda_meta) else env_path
+    return os.stat(stamp_path).st_mtime_ns
+
+def env_stamp(env_name):
+    """Change stamp for a named environment, or None if its path is unknown."""
+    env_path = get_env_path(env_name)
+    return _env_stamp(env_path) if env_path and os.path.exists(env_path) else None
+
 def get_env_size(env_path):
     """Calculate the size of a conda environment."""
     if not env_path or not os.path.exists(env_path):
         return "Unknown"
 
-    total_size = 0
     try:
-        for dirpath, dirnames, filenames in os.walk(env_path):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                if os.path.exists(fp):
-                    total_size += os.path.getsize(fp)
+        total_size = _env_size_bytes(env_path, _env_stamp(env_path))
 
         # Convert to human readable
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -701,34 +954,45 @@ def get_env_size(env_path):
     except Exception:
         return "Unknown"
 
+@functools.lru_cache(maxsize=16)
+def _env_packages_cached(env_name, stamp):
+    """Run `conda list --json` for an environment, cached per change stamp."""
+    return tuple(_conda_json('list', '--name', env_name))
+
+def env_packages(env_name):
+    """Get the package records of an environment from `conda list --json`.
+
+    One listing answers both the Python version and the package count, and
+    it is reused until the environment changes.
+    """
+    return _env_packages_cached(env_name, env_stamp(env_name))
+
 def get_env_python_version(env_name):
     """Get the Python version in a conda environment."""
     try:
-        result = subprocess.run(
-            ['conda', 'run', '-n', env_name, 'python', '--version'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip().replace('Python ', '')
-    except subprocess.CalledProcessError:
+        return next((p['version'] for p in env_packages(env_name) if p.get('name') == 'python'),
+                    "Unknown")
+    except (subprocess.CalledProcessError, ValueError, OSError):
         return "Unknown"
 
 def count_env_packages(env_name):
     """Count installed packages in a conda environment."""
     try:
-        result = subprocess.run(
-            ['conda', 'list', '--name', env_name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        # Count non-empty, non-comment lines
-        lines = [l for l in result.stdout.splitlines() if l and not l.startswith('#')]
-        return len(lines)
-    except subprocess.CalledProcessError:
+        return len(env_packages(env_name))
+    except (subprocess.CalledProcessError, ValueError, OSError):
         return 0
 
+def _gather_env_info(env_name, env_path):
+    """Collect (python version, size, package count) for show_env_info."""
+    from concurrent.futures import ThreadPoolExecutor
+    # Measure the size in the background while conda lists the packages;
+    # the Python version and package count come from that one listing
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        env_size = executor.submit(get_env_size, env_path)
+        python_version = get_env_python_version(env_name)
+        package_count = count_env_packages(env_name)
+        return python_version, env_size.result(), package_count
+
 def show_env_info(env_name):
     """Display detailed information about a conda environment."""
     print_header()
@@ -739,11 +1003,9 @@ def show_env_info(env_name):
         print_error(f"Environment '{env_name}' not found")
         return
 
-    show_spinner(1, "Gathering environment info")
-
-    python_version = get_env_python_version(env_name)
-    env_size = get_env_size(env_path)
-    package_count = count_env_packages(env_name)
+    python_version, env_size, package_count = with_spinner(
+        "Gathering environment info", _gather_env_info, env_name, env_path
+    )
 
     print(f"{BLUE}Name:           {WHITE}{env_name}{RESET}")
     print(f"{BLUE}Path:           {WHITE}{env_path}{RESET}")
@@ -752,10 +1014,9 @@ def show_env_info(env_name):
     print(f"{BLUE}Packages:       {WHITE}{package_count}{RESET}")
 
     # Check for requirements.txt or environment.yml
-    req_files = ['requirements.txt', 'environment.yml', 'environment.yaml']
-    cwd = os.getcwd()
-    for req_file in req_files:
-        if os.path.exists(os.path.join(cwd, req_file)):
+    names, _ = scan_cwd()
+    for req_file in ('requirements.txt', 'environment.yml', 'environment.yaml'):
+        if req_file in names:
             print(f"{BLUE}Found:          {WHITE}{req_file} in current directory{RESET}")
 
     logging.info(f"Displayed info for environment: {env_name}")
@@ -764,16 +1025,15 @@ def uninstall_package(env_name, package):
     """Uninstall a package from a conda environment."""
     if confirm_action(f"Are you sure you want to uninstall '{package}' from '{env_name}'?"):
         try:
-            show_progress(f"Uninstalling {package}")
             cmd = ['conda', 'remove', '--name', env_name, package, '-y']
-            subprocess.run(cmd, check=True, capture_output=True)
+            run_with_progress(cmd, f"Uninstalling {package}")
             print_success(f"Package '{package}' uninstalled successfully")
             logging.info(f"Uninstalled {package} from {env_name}")
         except subprocess.CalledProcessError:
             print_warning(f"Conda uninstall failed, trying pip...")
             try:
                 cmd = ['conda', 'run', '-n', env_name, 'pip', 'uninstall', package, '-y']
-                subprocess.run(cmd, check=True, capture_output=True)
+                run_with_progress(cmd, f"Uninstalling {package} with pip")
                 print_success(f"Package '{package}' uninstalled via pip")
                 logging.info(f"Uninstalled {package} via pip from {env_name}")
             except subprocess.CalledProcessError:
@@ -782,29 +1042,38 @@ def uninstall_package(env_name, package):
     else:
         print_warning("Uninstall cancelled")
 
+# Row templates for package and numbered-menu listings; colors are baked in
+# once so loops only fill in the values
+_PKG_FMT = f"{GREEN}{{:30}}{WHITE}{{}}{RESET}".format
+_MENU_FMT = f"{GREEN}{{}}. {WHITE}{{}}{RESET}".format
+
+# Name and version columns of a `conda list` row
+_PKG_LINE_RE = re.compile(r"\s*(\S+)\s+(\S+)")
+
+# Stop reading `conda list` once this many packages have matched a search
+MAX_SEARCH_RESULTS = 1000
+
 def search_env_packages(env_name, query):
     """Search for packages in a conda environment."""
     try:
-        result = subprocess.run(
-            ['conda', 'list', '--name', env_name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
+        needle = query.lower()
         matches = []
-        for line in result.stdout.splitlines():
-            if line and not line.startswith('#') and query.lower() in line.lower():
+        for line in iter_conda_list(env_name):
+            if line and not line.startswith('#') and needle in line.lower():
                 matches.append(line)
+                if len(matches) >= MAX_SEARCH_RESULTS:
+                    break
 
         if matches:
             print(f"\n{CYAN}Found {len(matches)} package(s) matching '{query}':{RESET}\n")
+            if len(matches) >= MAX_SEARCH_RESULTS:
+                print_info(f"Showing the first {MAX_SEARCH_RESULTS} matches, narrow the search to see more")
+            rows = []
             for match in matches:
-                parts = match.split()
-                if len(parts) >= 2:
-                    print(f"{GREEN}{parts[0]:30}{WHITE}{parts[1]}{RESET}")
-                else:
-                    print(f"{GREEN}{match}{RESET}")
+                row = _PKG_LINE_RE.match(match)
+                rows.append(_PKG_FMT(*row.groups()) if row else f"{GREEN}{match}{RESET}")
+            sys.stdout.write("\n".join(rows) + "\n")
+            sys.stdout.flush()
         else:
             print_warning(f"No packages matching '{query}' found in '{env_name}'")
 
@@ -813,6 +1082,8 @@ def search_env_packages(env_name, query):
         print_error("Failed to search packages")
         logging.error(f"Failed to search packages in {env_name}")
 
+_SETTINGS_CHOICES = frozenset('12345')
+
 def show_settings():
     """Display and modify settings."""
     while True:
@@ -828,7 +1099,7 @@ def show_settings():
         print(f"{GREEN}4. Change export format{RESET}")
         print(f"{GREEN}5. Save and return{RESET}")
         
-        choice = get_valid_input("Enter choice", lambda x: x in '12345')
+        choice = get_valid_input("Enter choice", _SETTINGS_CHOICES.__contains__)
         
         if choice == '1':
             config['python_version'] = get_valid_input("Enter Python version")
@@ -842,49 +1113,54 @@ def show_settings():
             save_config(config)
             break
 
+# Command summary shown by the help screen (menu option 19)
+HELP_SECTIONS = (
+    ("Conda Commands", [
+        ("Create Environment", "Create a new Conda environment"),
+        ("List/Search", "View or search existing environments"),
+        ("Activate", "Show activation instructions"),
+        ("Deactivate", "Show deactivation instructions"),
+        ("Delete", "Remove an environment"),
+        ("Export", "Save environment configuration"),
+        ("Packages", "List installed packages"),
+        ("Clone", "Create a copy of an environment"),
+        ("Update", "Update all packages in an environment"),
+        ("Repair", "Fix a broken environment")
+    ]),
+    ("Virtual Environment", [
+        ("Create Venv", "Create a Python virtual environment"),
+        ("Activate Venv", "Activate a virtual environment"),
+        ("Deactivate Venv", "Deactivate current virtual environment")
+    ]),
+    ("System", [
+        ("Settings", "Configure manager options"),
+        ("Help", "Show this help menu"),
+        ("Exit", "Quit the program")
+    ])
+)
+
+def _build_help_text():
+    """Assemble the colored help screen once; the sections never change."""
+    lines = [f"{SECTION_HEADER} Available Commands {RESET}\n"]
+    for section, items in HELP_SECTIONS:
+        lines.append(f"{PURPLE}{section}:{RESET}")
+        for cmd, desc in items:
+            lines.append(f"{BLUE}{cmd:15}{RESET} - {WHITE}{desc}{RESET}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+_HELP_TEXT = _build_help_text()
+
 def show_help():
     """Display help information."""
     print_header()
-    print(f"{SECTION_HEADER} Available Commands {RESET}\n")
-    help_sections = [
-        ("Conda Commands", [
-            ("Create Environment", "Create a new Conda environment"),
-            ("List/Search", "View or search existing environments"),
-            ("Activate", "Show activation instructions"),
-            ("Deactivate", "Show deactivation instructions"),
-            ("Delete", "Remove an environment"),
-            ("Export", "Save environment configuration"),
-            ("Packages", "List installed packages"),
-            ("Clone", "Create a copy of an environment"),
-            ("Update", "Update all packages in an environment"),
-            ("Repair", "Fix a broken environment")
-        ]),
-        ("Virtual Environment", [
-            ("Create Venv", "Create a Python virtual environment"),
-            ("Activate Venv", "Activate a virtual environment"),
-            ("Deactivate Venv", "Deactivate current virtual environment")
-        ]),
-        ("System", [
-            ("Settings", "Configure manager options"),
-            ("Help", "Show this help menu"),
-            ("Exit", "Quit the program")
-        ])
-    ]
-    
-    for section, items in help_sections:
-        print(f"{PURPLE}{section}:{RESET}")
-        for cmd, desc in items:
-            print(f"{BLUE}{cmd:15}{RESET} - {WHITE}{desc}{RESET}")
-        print()
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
     
     input(f"\n{YELLOW}Press Enter to continue...{RESET}")
 
-def parse_args():
-    """Parse command line arguments with enhanced options."""
-    parser = argparse.ArgumentParser(
-        description="Conda Environment Manager v5.6 - A powerful tool for managing Conda environments",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Help text shown after the option list by --help
+EPILOG = """
 ================================================================================
                          CONDA ENVIRONMENT MANAGER v5.6
 ================================================================================
@@ -993,51 +1269,106 @@ TIPS:
 
 ================================================================================
         """
+
+# Command-line options, kept as data so the full argparse parser is only
+# built when the fast path in parse_args() can't handle the command line
+ARG_GROUPS = (
+    ('Environment Management', (
+        (('--create',), dict(help="Create a new conda environment", metavar='ENV_NAME')),
+        (('--delete',), dict(help="Delete an environment", metavar='ENV_NAME')),
+        (('--clone',), dict(nargs=2, help="Clone environment", metavar=('SOURCE', 'DEST'))),
+        (('--update',), dict(help="Update all packages in environment", metavar='ENV_NAME')),
+        (('--repair',), dict(help="Attempt to repair broken environment", metavar='ENV_NAME')),
+    )),
+    ('Information & Discovery', (
+        (('--list',), dict(help="List all conda environments", action='store_true')),
+        (('--info',), dict(help="Show environment info (path, size, packages)", metavar='ENV_NAME')),
+        (('--detect',), dict(help="Auto-detect conda files in current directory", action='store_true')),
+        (('--packages',), dict(help="List all packages in environment", metavar='ENV_NAME')),
+        (('--search',), dict(nargs=2, help="Search packages in environment", metavar=('ENV_NAME', 'QUERY'))),
+    )),
+    ('Package Management', (
+        (('--install',), dict(nargs=2, help="Install a package", metavar=('ENV_NAME', 'PACKAGE'))),
+        (('--uninstall',), dict(nargs=2, help="Uninstall a package", metavar=('ENV_NAME', 'PACKAGE'))),
+    )),
+    ('Export & Backup', (
+        (('--export',), dict(help="Export environment to YAML file", metavar='ENV_NAME')),
+        (('--requirements',), dict(help="Export to requirements.txt format", metavar='ENV_NAME')),
+    )),
+    ('Display Options', (
+        (('--no-color',), dict(help="Disable colored output", action='store_true')),
+        (('--force-color',), dict(help="Force colored output", action='store_true')),
+        (('--sudo-off',), dict(help="Disable sudo password prompt", action='store_true')),
+    )),
+    ('Easter Eggs', (
+        (('--bunny',), dict(action='store_true', help="🐰 A surprise awaits...")),
+    )),
+)
+
+def _arg_dest(flag):
+    """argparse's attribute name for a long option, e.g. --no-color -> no_color."""
+    return flag.lstrip('-').replace('-', '_')
+
+# Defaults for every option, and the options the fast path understands:
+# plain switches and single-value options (flag -> (dest, takes_value))
+ARG_DEFAULTS = {}
+_FAST_FLAGS = {}
+for _title, _options in ARG_GROUPS:
+    for _flags, _kwargs in _options:
+        _dest = _arg_dest(_flags[0])
+        _is_switch = _kwargs.get('action') == 'store_true'
+        ARG_DEFAULTS[_dest] = False if _is_switch else None
+        if 'nargs' not in _kwargs:
+            _FAST_FLAGS[_flags[0]] = (_dest, not _is_switch)
+del _title, _options, _flags, _kwargs, _dest, _is_switch
+
+def build_parser():
+    """Build the full argparse parser (needed for --help and unusual command lines)."""
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Conda Environment Manager v5.6 - A powerful tool for managing Conda environments",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
+    for title, options in ARG_GROUPS:
+        group = parser.add_argument_group(title)
+        for flags, kwargs in options:
+            group.add_argument(*flags, **kwargs)
+    return parser
 
-    # Environment Management
-    env_group = parser.add_argument_group('Environment Management')
-    env_group.add_argument('--create', help="Create a new conda environment", metavar='ENV_NAME')
-    env_group.add_argument('--delete', help="Delete an environment", metavar='ENV_NAME')
-    env_group.add_argument('--clone', nargs=2, help="Clone environment", metavar=('SOURCE', 'DEST'))
-    env_group.add_argument('--update', help="Update all packages in environment", metavar='ENV_NAME')
-    env_group.add_argument('--repair', help="Attempt to repair broken environment", metavar='ENV_NAME')
-
-    # Information & Discovery
-    info_group = parser.add_argument_group('Information & Discovery')
-    info_group.add_argument('--list', help="List all conda environments", action='store_true')
-    info_group.add_argument('--info', help="Show environment info (path, size, packages)", metavar='ENV_NAME')
-    info_group.add_argument('--detect', help="Auto-detect conda files in current directory", action='store_true')
-    info_group.add_argument('--packages', help="List all packages in environment", metavar='ENV_NAME')
-    info_group.add_argument('--search', nargs=2, help="Search packages in environment", metavar=('ENV_NAME', 'QUERY'))
-
-    # Package Management
-    pkg_group = parser.add_argument_group('Package Management')
-    pkg_group.add_argument('--install', nargs=2, help="Install a package", metavar=('ENV_NAME', 'PACKAGE'))
-    pkg_group.add_argument('--uninstall', nargs=2, help="Uninstall a package", metavar=('ENV_NAME', 'PACKAGE'))
-
-    # Export & Backup
-    export_group = parser.add_argument_group('Export & Backup')
-    export_group.add_argument('--export', help="Export environment to YAML file", metavar='ENV_NAME')
-    export_group.add_argument('--requirements', help="Export to requirements.txt format", metavar='ENV_NAME')
-
-    # Display Options
-    display_group = parser.add_argument_group('Display Options')
-    display_group.add_argument('--no-color', help="Disable colored output", action='store_true')
-    display_group.add_argument('--force-color', help="Force colored output", action='store_true')
-    display_group.add_argument('--sudo-off', help="Disable sudo password prompt", action='store_true')
-
-    # Easter Eggs
-    easter_group = parser.add_argument_group('Easter Eggs')
-    easter_group.add_argument('--bunny', action='store_true',
-                             help="🐰 A surprise awaits...")
-
-    return parser.parse_args()
+def _parse_args_fast(argv):
+    """Parse simple command lines (e.g. --list, --info ENV) without argparse.
 
-def rainbow_bunny():
-    """Display a rainbow-colored bunny!"""
-    colors = [RED, YELLOW, GREEN, CYAN, BLUE, MAGENTA]
-    bunny_art = r"""
+    Returns None for anything else - help, unknown or abbreviated flags,
+    multi-value options - so the full parser can handle (or reject) it.
+    """
+    values = dict(ARG_DEFAULTS)
+    i = 0
+    while i < len(argv):
+        spec = _FAST_FLAGS.get(argv[i])
+        if spec is None:
+            return None
+        dest, takes_value = spec
+        if takes_value:
+            if i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+                return None
+            values[dest] = argv[i + 1]
+            i += 2
+        else:
+            values[dest] = True
+            i += 1
+    return types.SimpleNamespace(**values)
+
+@functools.lru_cache(maxsize=1)
+def parse_args():
+    """Parse command line arguments with enhanced options (once per process)."""
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
+    return args
+
+# Easter egg art for --bunny
+BUNNY_ART = r"""
            /\ /|
           |||| |
            \ | \
@@ -1047,71 +1378,154 @@ def rainbow_bunny():
    \|     /__| |
      \_____) \__)
     """
-    print()
-    lines = bunny_art.split('\n')
-    for i, line in enumerate(lines):
-        color = colors[i % len(colors)]
-        print(f"{color}{line}{RESET}")
 
-    print(f"\n{MAGENTA}🐰 Bunny says: 'Your environments are hopping along nicely!' 🐰{RESET}")
-    print(f"{CYAN}   Easter egg found! Rangers lead the way!{RESET}\n")
+def _build_rainbow_bunny():
+    """Color the bunny once at import; every line gets the next rainbow color."""
+    colors = [RED, YELLOW, GREEN, CYAN, BLUE, MAGENTA]
+    lines = [""]
+    for i, line in enumerate(BUNNY_ART.split('\n')):
+        lines.append(f"{colors[i % len(colors)]}{line}{RESET}")
+    lines.append(f"\n{MAGENTA}🐰 Bunny says: 'Your environments are hopping along nicely!' 🐰{RESET}")
+    lines.append(f"{CYAN}   Easter egg found! Rangers lead the way!{RESET}\n")
+    return "\n".join(lines) + "\n"
+
+_RAINBOW_BUNNY = _build_rainbow_bunny()
+
+def rainbow_bunny():
+    """Display a rainbow-colored bunny!"""
+    sys.stdout.write(_RAINBOW_BUNNY)
+    sys.stdout.flush()
+
+def _search_packages_prompt(env_name):
+    """Menu option 8: ask for a search term, then search the environment."""
+    query = get_valid_input("Enter search term")
+    search_env_packages(env_name, query)
+
+def _clone_environment_prompt(env_name):
+    """Menu option 11: ask for the clone's name, then clone the environment."""
+    clone_environment(env_name, get_valid_input("Enter name for the new environment"))
+
+def _install_package_prompt(env_name):
+    """Menu option 13: ask for a package spec, then install it."""
+    install_package(env_name, get_valid_input("Enter package name (and version if needed, e.g. 'numpy==1.21.0')"))
+
+def _uninstall_package_prompt(env_name):
+    """Menu option 14: ask for a package name, then uninstall it."""
+    package = get_valid_input("Enter package name to uninstall")
+    uninstall_package(env_name, package)
+
+# Menu options that first ask which environment to act on, and the
+# function each one calls with the chosen environment's name
+ENV_MENU_ACTIONS = {
+    '3': show_env_info,
+    '5': show_activation_instructions,
+    '6': delete_environment,
+    '7': list_packages,
+    '8': _search_packages_prompt,
+    '9': export_environment,
+    '10': export_requirements,
+    '11': _clone_environment_prompt,
+    '12': update_environment,
+    '13': _install_package_prompt,
+    '14': _uninstall_package_prompt,
+    '15': repair_environment,
+}
+
+def prompt_for_env(existing_envs):
+    """Ask for an environment by its menu number and return its name."""
+    env_num = get_valid_input(
+        "Enter environment number",
+        env_number_validator(len(existing_envs))
+    )
+    return existing_envs[int(env_num) - 1]
+
+# Main menu sections; options are numbered in this order
+MENU_ITEMS = (
+    ("Conda Environment", [
+        "Create new Conda environment",
+        "List/Search environments",
+        "Show environment info",
+        "Detect local conda files",
+        "Activate environment",
+        "Delete environment",
+        "List packages",
+        "Search packages",
+        "Export environment",
+        "Export requirements",
+        "Clone environment",
+        "Update environment",
+        "Install package",
+        "Uninstall package",
+        "Repair environment",
+        "Show deactivation instructions"
+    ]),
+    ("Additional Tools", [
+        "Switch to Virtual Environment Manager"
+    ]),
+    ("System", [
+        "Settings",
+        "Help",
+        "Exit"
+    ])
+)
+
+def _build_menu_body():
+    """Number and color the menu options once; they never change between renders."""
+    lines = [f"\n{SECTION_HEADER} Menu Options {RESET}"]
+    current_index = 1
+    for section, items in MENU_ITEMS:
+        lines.append(f"\n{PURPLE}{section}:{RESET}")
+        for item in items:
+            lines.append(_MENU_FMT(current_index, item))
+            current_index += 1
+    return "\n".join(lines), str(current_index - 1)
+
+_MENU_BODY, _EXIT_CHOICE = _build_menu_body()
+
+# Prompt history kept between menu sessions (up-arrow recalls earlier env names)
+HISTORY_FILE = os.path.expanduser("~/.conda_setup_history")
+HISTORY_LENGTH = 100
+
+def setup_history():
+    """Enable readline line editing for input() and load the saved prompt history."""
+    try:
+        import readline
+    except ImportError:  # Windows without pyreadline
+        return
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # First run, or the file is unreadable
+    atexit.register(_save_history, readline)
+
+def _save_history(readline):
+    """Write the prompt history back out when the program exits."""
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError as e:
+        logging.warning(f"Could not save prompt history: {e}")
 
 def main_menu():
     """Main program menu."""
-    args = parse_args()
-
+    setup_history()
     while True:
-        existing_envs = check_existing_envs()
+        existing_envs = check_existing_envs(max_age=MENU_ENV_CACHE_TTL)
         print_header()
         
         if existing_envs:
-            print(f"{SECTION_HEADER} Available Conda Environments {RESET}")
-            print()
-            for i, env in enumerate(existing_envs, 1):
-                print(f"{GREEN}{i}. {WHITE}{env}{RESET}")
+            lines = [f"{SECTION_HEADER} Available Conda Environments {RESET}", ""]
+            lines += [_MENU_FMT(i, env) for i, env in enumerate(existing_envs, 1)]
         else:
-            print(f"{YELLOW}No Conda environments found{RESET}")
-        
-        print(f"\n{SECTION_HEADER} Menu Options {RESET}")
-        menu_items = [
-            ("Conda Environment", [
-                "Create new Conda environment",
-                "List/Search environments",
-                "Show environment info",
-                "Detect local conda files",
-                "Activate environment",
-                "Delete environment",
-                "List packages",
-                "Search packages",
-                "Export environment",
-                "Export requirements",
-                "Clone environment",
-                "Update environment",
-                "Install package",
-                "Uninstall package",
-                "Repair environment",
-                "Show deactivation instructions"
-            ]),
-            ("Additional Tools", [
-                "Switch to Virtual Environment Manager"
-            ]),
-            ("System", [
-                "Settings",
-                "Help",
-                "Exit"
-            ])
-        ]
+            lines = [f"{YELLOW}No Conda environments found{RESET}"]
         
-        current_index = 1
-        for section, items in menu_items:
-            print(f"\n{PURPLE}{section}:{RESET}")
-            for item in items:
-                print(f"{GREEN}{current_index}. {WHITE}{item}{RESET}")
-                current_index += 1
+        lines.append(_MENU_BODY)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         choice = input(f"\n{CYAN}Enter your choice: {RESET}")
 
-        if choice == str(current_index - 1) or choice == '20':  # Exit option
+        if choice == _EXIT_CHOICE or choice == '20':  # Exit option
             if input(f"{CYAN}Are you sure you want to exit? (y/n): {RESET}").lower().startswith('y'):
                 print_success("Goodbye!")
                 logging.info("Program terminated normally")
@@ -1142,12 +1556,6 @@ def main_menu():
         elif choice == '2':
             query = get_valid_input("Enter search term (or press Enter to list all)")
             search_environments(query, existing_envs)
-        elif choice == '3' and existing_envs:  # Show environment info
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            show_env_info(existing_envs[int(env_num)-1])
         elif choice == '4':  # Detect local conda files
             detected = detect_local_conda_env()
             if detected:
@@ -1159,74 +1567,8 @@ def main_menu():
                         print(f"{GREEN}📁 {name}{RESET} (local conda env)")
             else:
                 print_warning("No conda environment files found in current directory")
-        elif choice == '5' and existing_envs:  # Activate environment
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            show_activation_instructions(existing_envs[int(env_num)-1])
-        elif choice == '6' and existing_envs:  # Delete environment
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            delete_environment(existing_envs[int(env_num)-1])
-        elif choice == '7' and existing_envs:  # List packages
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            list_packages(existing_envs[int(env_num)-1])
-        elif choice == '8' and existing_envs:  # Search packages
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            query = get_valid_input("Enter search term")
-            search_env_packages(existing_envs[int(env_num)-1], query)
-        elif choice == '9' and existing_envs:  # Export environment
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            export_environment(existing_envs[int(env_num)-1])
-        elif choice == '10' and existing_envs:  # Export requirements
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            export_requirements(existing_envs[int(env_num)-1])
-        elif choice == '11' and existing_envs:  # Clone environment
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            clone_environment(existing_envs[int(env_num)-1], get_valid_input("Enter name for the new environment"))
-        elif choice == '12' and existing_envs:  # Update environment
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            update_environment(existing_envs[int(env_num)-1])
-        elif choice == '13' and existing_envs:  # Install package
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            install_package(existing_envs[int(env_num)-1], get_valid_input("Enter package name (and version if needed, e.g. 'numpy==1.21.0')"))
-        elif choice == '14' and existing_envs:  # Uninstall package
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            package = get_valid_input("Enter package name to uninstall")
-            uninstall_package(existing_envs[int(env_num)-1], package)
-        elif choice == '15' and existing_envs:  # Repair environment
-            env_num = get_valid_input(
-                "Enter environment number",
-                lambda x: x.isdigit() and 1 <= int(x) <= len(existing_envs)
-            )
-            repair_environment(existing_envs[int(env_num)-1])
+        elif choice in ENV_MENU_ACTIONS and existing_envs:  # Options acting on one environment
+            ENV_MENU_ACTIONS[choice](prompt_for_env(existing_envs))
         elif choice == '16':  # Show deactivation instructions
             show_deactivation_instructions()
         elif choice == '18':  # Settings
@@ -1237,15 +1579,18 @@ def main_menu():
         if choice not in ['18', '19']:  # Don't wait after settings or help
             input(f"\n{YELLOW}Press Enter to continue...{RESET}")
 
+# Arguments that can accompany --bunny on the no-parse shortcut in main()
+_BUNNY_ARGS = frozenset(('--bunny', '--no-color'))
+
 def main():
     """Main entry point with enhanced argument handling."""
-    args = parse_args()
-
-    # Handle color disable
-    if args.no_color:
-        init(strip=True)
+    # Easter egg check first (no requirements or argument parsing needed)
+    argv = sys.argv[1:]
+    if '--bunny' in argv and _BUNNY_ARGS.issuperset(argv):
+        rainbow_bunny()
+        return
 
-    # Easter egg check first (no requirements needed)
+    args = parse_args()
     if args.bunny:
         rainbow_bunny()
         return
@@ -1295,7 +1640,7 @@ def main():
         elif args.search:
             search_env_packages(args.search[0], args.search[1])
         elif args.packages:
-            list_packages(args.packages)
+            list_packages(args.packages, cache=False)  # Process exits right after
         else:
             main_menu()
             
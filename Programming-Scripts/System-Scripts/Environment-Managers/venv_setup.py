@@ -24,15 +24,15 @@ import os
 import sys
 import subprocess
 import shutil
-import time
 import logging
 import json
 import argparse
 import platform
-import getpass
+import functools
+import glob
+import re
+import threading
 from pathlib import Path
-from colorama import init, Fore, Style, Back
-from tqdm import tqdm
 
 # Platform-specific settings
 PLATFORM = platform.system().lower()
@@ -43,74 +43,42 @@ IS_LINUX = PLATFORM == 'linux'
 # Get user home directory in a cross-platform way
 HOME_DIR = str(Path.home())
 
-# Initialize colorama with Windows support
-init(autoreset=True, strip=False)
+_IS_TTY = sys.stdout.isatty()
 
-# Enhanced color constants
-CYAN = Fore.CYAN
-GREEN = Fore.GREEN + Style.BRIGHT
-YELLOW = Fore.YELLOW
-RED = Fore.RED
-MAGENTA = Fore.MAGENTA + Style.BRIGHT
-BLUE = Fore.BLUE + Style.BRIGHT
-WHITE = Fore.WHITE + Style.BRIGHT
-GRAY = Fore.WHITE + Style.DIM
-PURPLE = Fore.MAGENTA
-RESET = Style.RESET_ALL
-HIGHLIGHT = Back.BLUE + Fore.WHITE + Style.BRIGHT
-SECTION_HEADER = Back.CYAN + Fore.BLACK + Style.BRIGHT
-HEADER_BG = Back.BLUE + Fore.WHITE + Style.BRIGHT
-MENU_HEADER = Back.CYAN + Fore.BLACK + Style.BRIGHT
-SECTION_BG = Back.MAGENTA + Fore.WHITE + Style.BRIGHT
-OPTION_FG = Fore.GREEN + Style.BRIGHT
-WARNING_BG = Back.YELLOW + Fore.BLACK + Style.BRIGHT
-ERROR_BG = Back.RED + Fore.WHITE + Style.BRIGHT
-
-def request_sudo_password():
-    """Request sudo password at the start of the script."""
-    print()
-    print(f"{WARNING_BG} Sudo Access Required {RESET}")
-    print()
-    print(f"{YELLOW}This script requires sudo privileges for:{RESET}")
-    print()
-    print(f"{WHITE}1. Installing packages system-wide{RESET}")
-    print(f"{WHITE}2. Managing protected directories{RESET}")
-    print(f"{WHITE}3. Updating system Python installations{RESET}")
-    print()
-    print(f"{YELLOW}You can disable this prompt using --sudo-off{RESET}\n")
-    # if config['sudo_off']:
-    #     return
-    """Request sudo password at the start of the script."""
-    if os.geteuid() != 0:  # Check if not running as root
-        print(f"{YELLOW}This script requires sudo privileges.{RESET}")
-        try:
-            password = getpass.getpass(f"{CYAN}Enter sudo password: {RESET}")
-            cmd = ['sudo', '-S', 'echo', 'Sudo access granted']
-            result = subprocess.run(cmd, input=f"{password}\n", text=True, capture_output=True)
-            if result.returncode != 0:
-                print(f"{RED}Invalid sudo password. Exiting.{RESET}")
-                sys.exit(1)
-            os.environ['SUDO_ASKPASS'] = '/bin/echo'
-        except Exception as e:
-            print(f"{RED}Failed to get sudo access: {e}{RESET}")
-            sys.exit(1)
-
-# Check if running a read-only CLI command (no sudo needed)
-def needs_sudo():
-    """Check if the current command needs sudo access."""
-    read_only_args = ['--list', '--detect', '--info', '--packages', '--help', '-h', '--bunny']
-    for arg in sys.argv[1:]:
-        if arg in read_only_args or arg.startswith('--info=') or arg.startswith('--packages='):
-            return False
-    return True
-
-# Request sudo password only when needed
-if not platform.system().lower() == 'windows' and needs_sudo():
-    # Skip sudo for read-only operations
-    if len(sys.argv) > 1:
-        request_sudo_password()
-    # For interactive mode, we'll request sudo later if needed
+# Colors are used only on a terminal and when not turned off. With colors off
+# every color constant is an empty string, so colorama is never imported.
+COLORS_ENABLED = (_IS_TTY and '--no-color' not in sys.argv
+                  and not os.environ.get('NO_COLOR'))
 
+# Enhanced color constants
+if COLORS_ENABLED:
+    from colorama import Fore, Style, Back
+    if IS_WINDOWS:
+        # Only the Windows console needs colorama to translate ANSI codes
+        from colorama import init
+        init(autoreset=True, strip=False)
+    CYAN = Fore.CYAN
+    GREEN = Fore.GREEN + Style.BRIGHT
+    YELLOW = Fore.YELLOW
+    RED = Fore.RED
+    MAGENTA = Fore.MAGENTA + Style.BRIGHT
+    BLUE = Fore.BLUE + Style.BRIGHT
+    WHITE = Fore.WHITE + Style.BRIGHT
+    GRAY = Fore.WHITE + Style.DIM
+    PURPLE = Fore.MAGENTA
+    RESET = Style.RESET_ALL
+    HIGHLIGHT = Back.BLUE + Fore.WHITE + Style.BRIGHT
+    SECTION_HEADER = Back.CYAN + Fore.BLACK + Style.BRIGHT
+    HEADER_BG = Back.BLUE + Fore.WHITE + Style.BRIGHT
+    MENU_HEADER = Back.CYAN + Fore.BLACK + Style.BRIGHT
+    SECTION_BG = Back.MAGENTA + Fore.WHITE + Style.BRIGHT
+    OPTION_FG = Fore.GREEN + Style.BRIGHT
+    WARNING_BG = Back.YELLOW + Fore.BLACK + Style.BRIGHT
+    ERROR_BG = Back.RED + Fore.WHITE + Style.BRIGHT
+else:
+    CYAN = GREEN = YELLOW = RED = MAGENTA = BLUE = WHITE = GRAY = PURPLE = ''
+    RESET = HIGHLIGHT = SECTION_HEADER = HEADER_BG = MENU_HEADER = ''
+    SECTION_BG = OPTION_FG = WARNING_BG = ERROR_BG = ''
 
 def print_success(message):
     """Print a success message with a checkmark."""
@@ -134,7 +102,12 @@ def confirm_action(message="Are you sure?"):
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if IS_WINDOWS and not COLORS_ENABLED:
+        os.system('cls')  # No colorama to translate the escape codes
+        return
+    # Erase the screen and home the cursor without starting a `clear` process
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 # Display a warning message with an exclamation mark.
 def display_warning(message):
@@ -172,31 +145,38 @@ DEFAULT_CONFIG = {
     'theme': 'default'
 }
 
+# orjson parses faster when it is installed; the json module is the fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 def load_config():
     """Load configuration from file or create default if not exists."""
+    config = DEFAULT_CONFIG.copy()
     try:
         if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                loaded_config = json.load(f)
-                # Merge with defaults to ensure all required keys exist
-                config = {**DEFAULT_CONFIG, **loaded_config}
-                logging.info(f"Configuration loaded from {CONFIG_FILE}")
-                return config
+            # Fill the defaults in place so all required keys exist
+            config.update(_json_loads(Path(CONFIG_FILE).read_bytes()))
+            logging.info(f"Configuration loaded from {CONFIG_FILE}")
         else:
             # Create default config file
-            save_config(DEFAULT_CONFIG)
-            logging.info(f"Created new configuration file at {CONFIG_FILE}")
-            return DEFAULT_CONFIG
-    except (json.JSONDecodeError, IOError) as e:
+            if save_config(config):
+                logging.info(f"Created new configuration file at {CONFIG_FILE}")
+        return config
+    except (ValueError, IOError) as e:  # Both parsers raise ValueError subclasses
         logging.error(f"Error loading config from {CONFIG_FILE}: {e}")
         display_warning(f"Error loading config: {e}")
-        return DEFAULT_CONFIG
+        return DEFAULT_CONFIG.copy()
 
 def save_config(config):
     """Save configuration to file."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        # One write of the finished text rather than json.dump's many small
+        # writes, to a temp file swapped in so a crash never leaves half a file
+        tmp_file = f"{CONFIG_FILE}.tmp"
+        Path(tmp_file).write_text(json.dumps(config, indent=4))
+        os.replace(tmp_file, CONFIG_FILE)
         logging.info(f"Configuration saved to {CONFIG_FILE}")
         return True
     except IOError as e:
@@ -207,26 +187,62 @@ def save_config(config):
 # Initialize configuration
 config = load_config()
 
-def show_spinner(seconds, text="Processing"):
-    """Show a spinning cursor while processing."""
-    spinners = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-    for _ in range(int(seconds * 10)):
-        for spinner in spinners:
-            sys.stdout.write(f'\r{CYAN}{spinner} {text}...{RESET}')
-            sys.stdout.flush()
-            time.sleep(0.1)
+SPINNER_CHARS = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+
+def _spin_until(stop, text):
+    """Animate the spinner until `stop` is set, then clear it."""
+    i = 0
+    while True:
+        sys.stdout.write(f'\r{CYAN}{SPINNER_CHARS[i % len(SPINNER_CHARS)]} {text}...{RESET}')
+        sys.stdout.flush()
+        i += 1
+        if stop.wait(0.1):
+            break
     sys.stdout.write('\r' + ' ' * (len(text) + 15) + '\r')
     sys.stdout.flush()
 
-def show_progress(task_name, steps=50):
-    """Show a progress bar with customized styling."""
+def animations_enabled():
+    """Spinners and progress bars are cosmetic: only drawn on a terminal with animations on."""
+    return _IS_TTY and config.get('show_animations', True)
+
+def with_spinner(text, fn, /, *args, **kwargs):
+    """Call fn(*args, **kwargs) with a spinner running until it returns."""
+    if not animations_enabled():
+        return fn(*args, **kwargs)
+    stop = threading.Event()
+    spinner = threading.Thread(target=_spin_until, args=(stop, text), daemon=True)
+    spinner.start()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        stop.set()
+        spinner.join()
+
+def run_with_progress(cmd, task_name):
+    """Run a command, showing its live output on a progress bar; returns the output."""
     print(f"\n{CYAN}⚡ {task_name}...{RESET}")
-    for _ in tqdm(range(steps), 
-                 desc=f"{WHITE}{task_name}{RESET}",
-                 bar_format='{l_bar}{bar:30}{r_bar}',
-                 colour='green'):
-        time.sleep(0.02)
-    print()
+    if not animations_enabled():
+        # No bar to drive, so just collect the output (and never import tqdm)
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        output = proc.stdout
+    else:
+        from tqdm import tqdm  # Only needed once a long-running command starts
+        output = []
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            with tqdm(desc=f"{WHITE}{task_name}{RESET}",
+                      bar_format='{desc}: {elapsed}{postfix}',
+                      colour='green') as pbar:
+                for line in proc.stdout:
+                    output.append(line)
+                    line = line.strip()
+                    if line:
+                        pbar.set_postfix_str(line[:40])
+        print()
+        output = ''.join(output)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=output)
+    return output
 
 def check_admin_requirements():
     """Check and explain admin requirements based on platform."""
@@ -253,12 +269,13 @@ def check_admin_requirements():
         except Exception:
             admin_needed = False
     elif IS_LINUX or IS_MACOS:
-        # Check if user has sudo privileges
+        # Check if sudo would work without a password prompt; never ask for one here
         try:
-            subprocess.run(['sudo', '-n', 'true'], check=True, capture_output=True)
-            admin_needed = False
-        except:
+            admin_needed = os.geteuid() != 0 and subprocess.run(
+                ['sudo', '-n', 'true'], capture_output=True).returncode != 0
+        except OSError:  # No sudo binary
             admin_needed = True
+        if admin_needed:
             explanation = (
                 f"{'sudo' if IS_LINUX else 'administrator'} privileges may be required to:\n"
                 "1. Install packages system-wide\n"
@@ -272,51 +289,86 @@ def check_admin_requirements():
     
     return admin_needed
 
+# Header box and static system info, built once instead of on every redraw
+_HEADER = (
+    f"{MAGENTA}╔══════════════════════════════════════════════╗{RESET}\n"
+    f"{MAGENTA}║{HEADER_BG}         Python Virtual Environment Manager   {RESET}{MAGENTA}║{RESET}\n"
+    f"{MAGENTA}║{WHITE}            Version 2.3 - Enhanced            {RESET}{MAGENTA}║{RESET}\n"
+    f"{MAGENTA}╚══════════════════════════════════════════════╝{RESET}\n"
+    f"{MENU_HEADER} System Information {RESET}\n"
+    f"{BLUE}OS:     {WHITE}{platform.system()} {platform.release()}{RESET}\n"
+    f"{BLUE}Python: {WHITE}{sys.version.split()[0]}{RESET}\n"
+    f"{BLUE}venv:   {WHITE}"
+)
+
 def print_header():
     """Print a beautiful header with version and additional info."""
     clear_screen()
-    print(f"{MAGENTA}╔══════════════════════════════════════════════╗{RESET}")
-    print(f"{MAGENTA}║{HEADER_BG}         Python Virtual Environment Manager   {RESET}{MAGENTA}║{RESET}")
-    print(f"{MAGENTA}║{WHITE}            Version 2.3 - Enhanced            {RESET}{MAGENTA}║{RESET}")
-    print(f"{MAGENTA}╚══════════════════════════════════════════════╝{RESET}")
-    
-    print(f"{MENU_HEADER} System Information {RESET}")
-    print(f"{BLUE}OS:     {WHITE}{platform.system()} {platform.release()}{RESET}")
-    print(f"{BLUE}Python: {WHITE}{sys.version.split()[0]}{RESET}")
-    print(f"{BLUE}venv:   {WHITE}{'Available' if has_venv() else 'Not found'}{RESET}")
-    print()
+    sys.stdout.write(f"{_HEADER}{'Available' if has_venv() else 'Not found'}{RESET}\n\n")
 
+@functools.lru_cache(maxsize=1)
 def has_venv():
-    """Check if venv module is available."""
-    try:
-        subprocess.run([sys.executable, "-m", "venv", "--help"], 
-                      capture_output=True, 
-                      check=True)
-        return True
-    except:
-        return False
-
-def get_venv_path():
-    """Get the path where virtual environments should be created."""
-    if config['venv_location'] == 'custom':
-        path = Path(config['custom_venv_path'])
+    """Check if venv module is available (checked once, without starting Python again)."""
+    import importlib.util
+    return importlib.util.find_spec("venv") is not None
+
+@functools.lru_cache(maxsize=4)
+def _venv_root(location, custom_path):
+    """Resolve (and for a custom location, create) the venv directory once per setting."""
+    if location == 'custom':
+        path = Path(custom_path)
         path.mkdir(parents=True, exist_ok=True)
         return str(path)
     return os.getcwd()
 
+def get_venv_path():
+    """Get the path where virtual environments should be created."""
+    return _venv_root(config['venv_location'], config['custom_venv_path'])
+
+# Where the interpreter lives inside a venv
+PYTHON_RELPATH = os.path.join('Scripts', 'python.exe') if IS_WINDOWS else os.path.join('bin', 'python')
+
+# Skip pip's PyPI version check and any interactive prompts on every call
+PIP_FLAGS = ('--disable-pip-version-check', '--no-input')
+
+@functools.lru_cache(maxsize=64)
+def _pip_prefix(venv_root, venv_name):
+    """Build the pip command prefix once per venv; keyed on the root so a location change misses."""
+    return (os.path.join(venv_root, venv_name, PYTHON_RELPATH), '-m', 'pip', *PIP_FLAGS)
+
+@functools.lru_cache(maxsize=32)
+def _pip_installed(site_dirs, stamps):
+    """Check site-packages for the pip package; cached per directory mtimes."""
+    return any(os.path.isdir(os.path.join(site_dir, 'pip')) for site_dir in site_dirs)
+
+def require_pip(venv_name):
+    """Check that a venv can run pip, printing an error if it cannot."""
+    if _pip_installed(*_site_key(venv_name)):
+        return True
+    print_error(f"pip not found in virtual environment '{venv_name}'")
+    logging.error(f"pip not found in {os.path.join(get_venv_path(), venv_name)}")
+    return False
+
+def pip_command(venv_name):
+    """Get the command that runs a virtual environment's pip."""
+    return list(_pip_prefix(get_venv_path(), venv_name))
+
+def iter_venv_dirs(path):
+    """Yield the names of the virtual environments directly inside path.
+
+    Every venv has a pyvenv.cfg at its top level, so that one check both
+    confirms a venv and rules out ordinary bin/ or Scripts/ folders.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if (entry.is_dir(follow_symlinks=False)
+                    and DELETING_TAG not in entry.name  # Still being removed
+                    and os.path.exists(os.path.join(entry.path, 'pyvenv.cfg'))):
+                yield entry.name
+
 def check_existing_venvs():
     """Get list of Python virtual environments."""
-    venv_path = get_venv_path()
-    venvs = []
-    
-    for d in os.listdir(venv_path):
-        full_path = os.path.join(venv_path, d)
-        if os.path.isdir(full_path):
-            if (os.path.exists(os.path.join(full_path, 'Scripts')) or  # Windows
-                os.path.exists(os.path.join(full_path, 'bin'))):       # Unix
-                venvs.append(d)
-    
-    return sorted(venvs)
+    return sorted(iter_venv_dirs(get_venv_path()))
 
 def show_activation_instructions(venv_name):
     """Show how to activate a virtual environment."""
@@ -344,18 +396,25 @@ def show_activation_instructions(venv_name):
 
     return cmd, relative_cmd
 
+# Requirement files offered after creating a venv, in the order they are listed
+REQUIREMENT_FILES = ('requirements.txt', 'requirements-dev.txt', 'requirements-test.txt', 'dev-requirements.txt')
+DEPENDENCY_FILES = frozenset(REQUIREMENT_FILES + ('pyproject.toml',))
+
 def check_and_offer_requirements_install(venv_name):
     """Check for requirements.txt and offer to install dependencies."""
-    cwd = os.getcwd()
+    # One directory listing instead of a stat per candidate file
+    try:
+        with os.scandir(os.getcwd()) as entries:
+            found = {entry.name for entry in entries
+                     if entry.name in DEPENDENCY_FILES and entry.is_file()}
+    except OSError:
+        return
 
     # Check for various requirement files
-    req_files = []
-    for f in ['requirements.txt', 'requirements-dev.txt', 'requirements-test.txt', 'dev-requirements.txt']:
-        if os.path.exists(os.path.join(cwd, f)):
-            req_files.append(f)
+    req_files = [f for f in REQUIREMENT_FILES if f in found]
 
     # Also check for pyproject.toml with dependencies
-    has_pyproject = os.path.exists(os.path.join(cwd, 'pyproject.toml'))
+    has_pyproject = 'pyproject.toml' in found
 
     if not req_files and not has_pyproject:
         return
@@ -403,19 +462,14 @@ def check_and_offer_requirements_install(venv_name):
 
 def install_requirements_into_venv(venv_name, req_file):
     """Install dependencies from requirements.txt into venv."""
-    venv_path = os.path.join(get_venv_path(), venv_name)
-
-    if IS_WINDOWS:
-        pip_path = os.path.join(venv_path, 'Scripts', 'pip.exe')
-    else:
-        pip_path = os.path.join(venv_path, 'bin', 'pip')
+    if not require_pip(venv_name):
+        return
+    pip = pip_command(venv_name)
 
     try:
-        show_progress(f"Installing from {req_file}")
-        subprocess.run(
-            [pip_path, 'install', '-r', req_file],
-            check=True,
-            capture_output=True
+        run_with_progress(
+            [*pip, 'install', '-r', req_file],
+            f"Installing from {req_file}"
         )
         print_success(f"Dependencies from {req_file} installed successfully!")
         logging.info(f"Installed dependencies from {req_file} into {venv_name}")
@@ -425,19 +479,14 @@ def install_requirements_into_venv(venv_name, req_file):
 
 def install_pyproject_into_venv(venv_name):
     """Install package from pyproject.toml in editable mode."""
-    venv_path = os.path.join(get_venv_path(), venv_name)
-
-    if IS_WINDOWS:
-        pip_path = os.path.join(venv_path, 'Scripts', 'pip.exe')
-    else:
-        pip_path = os.path.join(venv_path, 'bin', 'pip')
+    if not require_pip(venv_name):
+        return
+    pip = pip_command(venv_name)
 
     try:
-        show_progress("Installing from pyproject.toml")
-        subprocess.run(
-            [pip_path, 'install', '-e', '.'],
-            check=True,
-            capture_output=True
+        run_with_progress(
+            [*pip, 'install', '-e', '.'],
+            "Installing from pyproject.toml"
         )
         print_success("Package installed from pyproject.toml successfully!")
         logging.info(f"Installed from pyproject.toml into {venv_name}")
@@ -457,11 +506,10 @@ def create_venv(name=None, with_pip=True):
     venv_path = os.path.join(get_venv_path(), name)
     
     try:
-        show_progress(f"Creating virtual environment '{name}'")
         cmd = [sys.executable, "-m", "venv"]
         cmd.append(venv_path)
         
-        subprocess.run(cmd, check=True, capture_output=True)
+        run_with_progress(cmd, f"Creating virtual environment '{name}'")
         print_success(f"Virtual environment '{name}' created successfully!")
         
         # Ask user if they want to activate now
@@ -494,6 +542,18 @@ def show_deactivation_instructions():
     print(f"{GREEN}deactivate{RESET}")
     print(f"{YELLOW}Note: Run this command in your terminal when done{RESET}")
 
+# Suffix a venv directory gets while it is being removed in the background
+DELETING_TAG = '.deleting.'
+
+def _remove_venv_tree(doomed, venv_path):
+    """Remove a renamed venv directory, logging the outcome (runs on a worker thread)."""
+    try:
+        shutil.rmtree(doomed)
+        # Enhance logging to include full paths and actions
+        logging.info(f"Action: Deleted virtual environment at {venv_path}")
+    except OSError as e:
+        logging.error(f"Failed to finish deleting {venv_path} (left at {doomed}): {e}")
+
 def delete_venv(name):
     """Delete a virtual environment."""
     if not config['confirm_deletions'] or input(
@@ -501,60 +561,68 @@ def delete_venv(name):
     ).lower().startswith('y'):
         try:
             venv_path = os.path.join(get_venv_path(), name)
-            show_progress(f"Deleting virtual environment '{name}'")
-            shutil.rmtree(venv_path)
+            # Move the venv out of the way (instant on the same filesystem) and
+            # remove the files in the background; the thread is not a daemon,
+            # so the program still waits for it before exiting
+            doomed = f"{venv_path}{DELETING_TAG}{os.getpid()}"
+            try:
+                os.rename(venv_path, doomed)
+            except OSError:
+                with_spinner(f"Deleting virtual environment '{name}'", shutil.rmtree, venv_path)
+                logging.info(f"Action: Deleted virtual environment at {venv_path}")
+            else:
+                threading.Thread(target=_remove_venv_tree, args=(doomed, venv_path)).start()
             print_success(f"Virtual environment '{name}' deleted successfully")
-            
-            # Enhance logging to include full paths and actions
-            logging.info(f"Action: Deleted virtual environment at {venv_path}")
         except Exception as e:
             print_error(f"Failed to delete virtual environment: {e}")
             logging.error(f"Failed to delete virtual environment {name}: {e}")
     else:
         print_warning("Deletion cancelled")
 
+def package_table(venv_name):
+    """Format a venv's packages as the same two-column table `pip list` prints."""
+    packages = [('Package', 'Version')] + installed_packages(venv_name)
+    width = max(len(name) for name, _ in packages)
+    packages.insert(1, ('-' * width, '-' * max(len(version) for _, version in packages)))
+    return [f"{name:{width}} {version}" for name, version in packages]
+
 def list_packages(venv_name):
     """List installed packages in a virtual environment."""
-    try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
-        
-        show_spinner(1, "Retrieving package list")
-        result = subprocess.run(
-            [pip, 'list'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(f"\n{CYAN}Packages in virtual environment '{venv_name}':{RESET}")
-        print(f"{WHITE}{result.stdout}{RESET}")
-        logging.info(f"Listed packages for: {venv_name}")
-    except subprocess.CalledProcessError:
+    if not os.path.isdir(os.path.join(get_venv_path(), venv_name)):
         print_error("Failed to list packages")
         logging.error(f"Failed to list packages for {venv_name}")
+        return
+
+    table = "\n".join(package_table(venv_name))
+    print(f"\n{CYAN}Packages in virtual environment '{venv_name}':{RESET}")
+    print(f"{WHITE}{table}{RESET}")
+    logging.info(f"Listed packages for: {venv_name}")
 
 def export_requirements(venv_name):
     """Export installed packages to requirements.txt."""
+    if not require_pip(venv_name):
+        return
     try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
+        pip = pip_command(venv_name)
         
         output_file = f"{venv_name}_requirements.txt"
-        show_progress("Exporting requirements")
-        
-        result = subprocess.run(
-            [pip, 'freeze'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        print_info("Exporting requirements...")
         
-        with open(output_file, 'w') as f:
-            f.write(result.stdout)
+        # stdout is the file content, so pip writes it straight into a temp
+        # file (no copy held in memory) that replaces the export on success
+        tmp_file = f"{output_file}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                subprocess.run(
+                    [*pip, 'freeze'],
+                    stdout=f,
+                    stderr=subprocess.PIPE,
+                    check=True
+                )
+            os.replace(tmp_file, output_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
         
         print_success(f"Requirements exported to {output_file}")
         
@@ -566,82 +634,70 @@ def export_requirements(venv_name):
 
 def install_package(venv_name):
     """Install a package in the virtual environment."""
+    if not require_pip(venv_name):
+        return
     package = input(f"{YELLOW}Enter package name (and version if needed, e.g. 'requests==2.25.1'): {RESET}")
     
     try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
+        pip = pip_command(venv_name)
         
-        show_progress(f"Installing {package}")
-        subprocess.run(
-            [pip, 'install', package],
-            check=True,
-            capture_output=True
-        )
+        run_with_progress([*pip, 'install', package], f"Installing {package}")
         print_success(f"Package '{package}' installed successfully")
         
         # Enhance logging to include full paths and actions
-        logging.info(f"Action: Installed package {package} in {venv_path}")
+        logging.info(f"Action: Installed package {package} in {os.path.join(get_venv_path(), venv_name)}")
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to install package: {e}")
         logging.error(f"Failed to install {package} in {venv_name}: {e}")
 
 def upgrade_pip(venv_name):
     """Upgrade pip in the virtual environment."""
+    if not require_pip(venv_name):
+        return
     try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
+        pip = pip_command(venv_name)
         
-        show_progress("Upgrading pip")
-        subprocess.run(
-            [pip, 'install', '--upgrade', 'pip'],
-            check=True,
-            capture_output=True
-        )
+        run_with_progress([*pip, 'install', '--upgrade', 'pip'], "Upgrading pip")
         print_success("Pip upgraded successfully")
         logging.info(f"Upgraded pip in {venv_name}")
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to upgrade pip: {e}")
         logging.error(f"Failed to upgrade pip in {venv_name}: {e}")
 
+# Conventional venv folder names, listed first when detected
+COMMON_VENV_NAMES = ('venv', 'env', '.venv', '.env', 'virtualenv')
+
 def detect_local_venv():
     """Auto-detect virtual environment in current directory."""
-    cwd = os.getcwd()
-    common_venv_names = ['venv', 'env', '.venv', '.env', 'virtualenv']
-
-    detected = []
-    for name in common_venv_names:
-        venv_path = os.path.join(cwd, name)
-        if os.path.isdir(venv_path):
-            if (os.path.exists(os.path.join(venv_path, 'Scripts')) or
-                os.path.exists(os.path.join(venv_path, 'bin'))):
-                detected.append(name)
-
-    # Also check for any directory that looks like a venv
-    for d in os.listdir(cwd):
-        if d not in detected and d not in common_venv_names:
-            full_path = os.path.join(cwd, d)
-            if os.path.isdir(full_path):
-                if (os.path.exists(os.path.join(full_path, 'Scripts')) or
-                    os.path.exists(os.path.join(full_path, 'bin'))):
-                    # Check for pyvenv.cfg to confirm it's a venv
-                    if os.path.exists(os.path.join(full_path, 'pyvenv.cfg')):
-                        detected.append(d)
-
+    found = list(iter_venv_dirs(os.getcwd()))
+    detected = [name for name in COMMON_VENV_NAMES if name in found]
+    detected += [name for name in found if name not in COMMON_VENV_NAMES]
     return detected
 
+def _scandir_size(path):
+    """Sum file sizes under path, reusing the stat data os.scandir already has."""
+    total_size = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            # Like os.walk, symlinked directories are not followed
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                        else:
+                            total_size += entry.stat().st_size
+                    except OSError:
+                        continue  # Broken symlink or vanished file
+        except OSError:
+            continue
+    return total_size
+
 def get_venv_size(venv_path):
     """Calculate the size of a virtual environment."""
-    total_size = 0
-    for dirpath, dirnames, filenames in os.walk(venv_path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            if os.path.exists(fp):
-                total_size += os.path.getsize(fp)
+    total_size = _scandir_size(venv_path)
 
     # Convert to human readable
     for unit in ['B', 'KB', 'MB', 'GB']:
@@ -650,49 +706,163 @@ def get_venv_size(venv_path):
         total_size /= 1024
     return f"{total_size:.1f} TB"
 
+@functools.lru_cache(maxsize=128)
+def _read_pyvenv(pyvenv_cfg, mtime_ns):
+    """Parse a pyvenv.cfg into a dict; cached until the file changes."""
+    with open(pyvenv_cfg, 'r') as f:
+        text = f.read()
+    return {key.strip(): value.strip()
+            for key, sep, value in (line.partition('=') for line in text.splitlines())
+            if sep}
+
 def get_venv_python_version(venv_name):
     """Get Python version used in a virtual environment."""
-    venv_path = os.path.join(get_venv_path(), venv_name)
-    pyvenv_cfg = os.path.join(venv_path, 'pyvenv.cfg')
+    pyvenv_cfg = os.path.join(get_venv_path(), venv_name, 'pyvenv.cfg')
+    try:
+        cfg = _read_pyvenv(pyvenv_cfg, os.stat(pyvenv_cfg).st_mtime_ns)
+    except OSError:
+        return "Unknown"
+    # The stdlib venv module writes `version`, virtualenv writes `version_info`
+    return cfg.get('version') or cfg.get('version_info') or "Unknown"
+
+def site_packages_dirs(venv_path):
+    """Get the site-packages directories of a virtual environment."""
+    if IS_WINDOWS:
+        return glob.glob(os.path.join(venv_path, 'Lib', 'site-packages'))
+    return glob.glob(os.path.join(venv_path, 'lib', 'python*', 'site-packages'))
+
+def _mtime_ns(path):
+    """Get a path's mtime in nanoseconds, or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=64)
+def _site_dirs_cached(venv_path, cfg_stamp):
+    """Glob a venv's site-packages once; only recreating the venv rewrites pyvenv.cfg."""
+    return tuple(site_packages_dirs(venv_path))
+
+# Metadata folders pip leaves for each installed distribution
+DIST_INFO_SUFFIXES = ('.dist-info', '.egg-info')
 
-    if os.path.exists(pyvenv_cfg):
-        with open(pyvenv_cfg, 'r') as f:
+def _dist_name_version(entry):
+    """Read (name, version) from a dist-info/egg-info entry's metadata headers."""
+    if entry.is_dir():
+        meta = 'METADATA' if entry.name.endswith('.dist-info') else 'PKG-INFO'
+        meta_path = os.path.join(entry.path, meta)
+    else:
+        meta_path = entry.path  # Old-style single-file egg-info
+    name = version = None
+    try:
+        with open(meta_path, 'r', encoding='utf-8', errors='replace') as f:
             for line in f:
-                if line.startswith('version'):
-                    return line.split('=')[1].strip()
-    return "Unknown"
+                if line.startswith('Name:'):
+                    name = line[5:].strip()
+                elif line.startswith('Version:'):
+                    version = line[8:].strip()
+                if (name and version) or line == '\n':  # Headers end at the first blank line
+                    break
+    except OSError:
+        pass
+    if not (name and version):
+        # Fall back to the folder name: <name>-<version>.dist-info
+        stem = os.path.splitext(entry.name)[0]
+        name, _, version = stem.partition('-')
+    return name, version
+
+@functools.lru_cache(maxsize=32)
+def _installed_cached(site_dirs, stamps):
+    """Scan site-packages for installed distributions; cached per directory mtimes."""
+    packages = []
+    for site_dir in site_dirs:
+        try:
+            with os.scandir(site_dir) as entries:
+                packages += [_dist_name_version(e) for e in entries
+                             if e.name.endswith(DIST_INFO_SUFFIXES)]
+        except OSError:
+            continue
+    return tuple(sorted(packages, key=lambda p: p[0].lower()))
+
+@functools.lru_cache(maxsize=32)
+def _count_cached(site_dirs, stamps):
+    """Count distributions in site-packages from the entry names alone; cached per directory mtimes."""
+    count = 0
+    for site_dir in site_dirs:
+        try:
+            with os.scandir(site_dir) as entries:
+                count += sum(1 for e in entries if e.name.endswith(DIST_INFO_SUFFIXES))
+        except OSError:
+            continue
+    return count
+
+def _site_key(venv_name):
+    """Get (site-packages dirs, their mtimes) for a venv, the key of the package caches."""
+    venv_path = os.path.join(get_venv_path(), venv_name)
+    site_dirs = _site_dirs_cached(venv_path, _mtime_ns(os.path.join(venv_path, 'pyvenv.cfg')))
+    return site_dirs, tuple(_mtime_ns(d) for d in site_dirs)
+
+def _installed(venv_name):
+    """Get the cached (name, version) tuple for a venv, rescanning only after a change."""
+    return _installed_cached(*_site_key(venv_name))
+
+def installed_packages(venv_name):
+    """Get the (name, version) pairs installed in a virtual environment.
+
+    Read from the dist-info metadata in site-packages rather than by
+    starting pip. Installing or removing anything changes site-packages'
+    mtime, so the cached list is reused until then.
+    """
+    return list(_installed(venv_name))
 
 def count_packages(venv_name):
-    """Count installed packages in a virtual environment."""
-    try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
+    """Count installed packages in a virtual environment.
 
-        result = subprocess.run(
-            [pip, 'list', '--format=freeze'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        packages = [p for p in result.stdout.strip().split('\n') if p]
-        return len(packages)
-    except:
-        return 0
+    Only the metadata folder names are needed for a count, so no METADATA
+    file is opened.
+    """
+    return _count_cached(*_site_key(venv_name))
+
+def _venv_meta(venv_name):
+    """Collect (package count, python version) for a venv listing line."""
+    return count_packages(venv_name), get_venv_python_version(venv_name)
+
+def gather_venv_meta(venvs):
+    """Map each venv name to its _venv_meta, reading the venvs side by side."""
+    if not venvs:
+        return {}
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(8, len(venvs))) as executor:
+        return dict(zip(venvs, executor.map(_venv_meta, venvs)))
+
+# Row templates for the venv listings; colors are baked in once so loops
+# only fill in the values
+_MENU_FMT = f"{GREEN}{{}}. {WHITE}{{}}{RESET}".format
+_VENV_FMT = f"{GREEN}{{}}. {{}}{RESET} ({GRAY}{{}} packages{RESET})".format
+_LOCAL_VENV_FMT = f"   {GREEN}→ {{}}{RESET} ({CYAN}Python {{}}{RESET}, {YELLOW}{{}} packages{RESET})".format
+
+# Basic info block of show_venv_info, filled in with format_map
+_VENV_INFO_TEMPLATE = (
+    f"\n{SECTION_HEADER} Virtual Environment Info {RESET}\n\n"
+    f"{BLUE}Name:           {WHITE}{{name}}{RESET}\n"
+    f"{BLUE}Path:           {WHITE}{{path}}{RESET}\n"
+    f"{BLUE}Python Version: {WHITE}{{python}}{RESET}\n"
+    f"{BLUE}Size:           {WHITE}{{size}}{RESET}\n"
+    f"{BLUE}Packages:       {WHITE}{{packages}}{RESET}"
+)
 
 def show_venv_info(venv_name):
     """Display detailed information about a virtual environment."""
     venv_path = os.path.join(get_venv_path(), venv_name)
 
-    print(f"\n{SECTION_HEADER} Virtual Environment Info {RESET}\n")
-
     # Basic info
-    print(f"{BLUE}Name:           {WHITE}{venv_name}{RESET}")
-    print(f"{BLUE}Path:           {WHITE}{venv_path}{RESET}")
-    print(f"{BLUE}Python Version: {WHITE}{get_venv_python_version(venv_name)}{RESET}")
-    print(f"{BLUE}Size:           {WHITE}{get_venv_size(venv_path)}{RESET}")
-    print(f"{BLUE}Packages:       {WHITE}{count_packages(venv_name)}{RESET}")
+    print(_VENV_INFO_TEMPLATE.format_map({
+        'name': venv_name,
+        'path': venv_path,
+        'python': get_venv_python_version(venv_name),
+        'size': get_venv_size(venv_path),
+        'packages': count_packages(venv_name),
+    }))
 
     # Check for requirements.txt
     req_file = os.path.join(os.path.dirname(venv_path), 'requirements.txt')
@@ -714,6 +884,8 @@ def show_venv_info(venv_name):
 
 def install_requirements(venv_name):
     """Install packages from requirements.txt."""
+    if not require_pip(venv_name):
+        return
     venv_path = os.path.join(get_venv_path(), venv_name)
 
     # Look for requirements.txt in common locations
@@ -736,30 +908,21 @@ def install_requirements(venv_name):
             return
 
     try:
-        if IS_WINDOWS:
-            pip = os.path.join(venv_path, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(venv_path, 'bin', 'pip')
+        pip = pip_command(venv_name)
 
         # Count packages to install
         with open(req_file, 'r') as f:
             pkg_count = len([l for l in f.readlines() if l.strip() and not l.startswith('#')])
 
         print(f"\n{CYAN}Installing {pkg_count} packages from {req_file}...{RESET}")
-        show_progress(f"Installing packages", steps=pkg_count * 10)
 
-        result = subprocess.run(
-            [pip, 'install', '-r', req_file],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
+        try:
+            run_with_progress([*pip, 'install', '-r', req_file], "Installing packages")
             print_success(f"Installed packages from {req_file}")
             logging.info(f"Installed requirements from {req_file} to {venv_name}")
-        else:
+        except subprocess.CalledProcessError as e:
             print_error(f"Some packages failed to install")
-            print(f"{YELLOW}{result.stderr}{RESET}")
+            print(f"{YELLOW}{e.output}{RESET}")
 
     except Exception as e:
         print_error(f"Failed to install requirements: {e}")
@@ -767,6 +930,8 @@ def install_requirements(venv_name):
 
 def uninstall_package(venv_name):
     """Uninstall a package from the virtual environment."""
+    if not require_pip(venv_name):
+        return
     # First list packages
     list_packages(venv_name)
 
@@ -782,17 +947,9 @@ def uninstall_package(venv_name):
         return
 
     try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
+        pip = pip_command(venv_name)
 
-        show_progress(f"Uninstalling {package}")
-        subprocess.run(
-            [pip, 'uninstall', '-y', package],
-            check=True,
-            capture_output=True
-        )
+        run_with_progress([*pip, 'uninstall', '-y', package], f"Uninstalling {package}")
         print_success(f"Package '{package}' uninstalled successfully")
         logging.info(f"Uninstalled {package} from {venv_name}")
     except subprocess.CalledProcessError as e:
@@ -801,21 +958,22 @@ def uninstall_package(venv_name):
 
 def update_all_packages(venv_name):
     """Update all packages in the virtual environment."""
+    if not require_pip(venv_name):
+        return
     try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
+        pip = pip_command(venv_name)
 
         # Get list of outdated packages
         print(f"\n{CYAN}Checking for outdated packages...{RESET}")
-        result = subprocess.run(
-            [pip, 'list', '--outdated', '--format=json'],
-            capture_output=True,
-            text=True
-        )
+        # Hand pip's raw bytes straight to the parser, skipping a decoded str copy
+        with subprocess.Popen(
+            [*pip, 'list', '--outdated', '--format=json'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        ) as proc:
+            output = proc.stdout.read()
 
-        outdated = json.loads(result.stdout) if result.stdout else []
+        outdated = _json_loads(output) if output.strip() else []
 
         if not outdated:
             print_success("All packages are up to date!")
@@ -830,17 +988,18 @@ def update_all_packages(venv_name):
             print_warning("Update cancelled")
             return
 
-        show_progress("Updating packages", steps=len(outdated) * 20)
-
-        for pkg in outdated:
-            subprocess.run(
-                [pip, 'install', '--upgrade', pkg['name']],
-                capture_output=True
-            )
+        # One pip run for every package, so startup and dependency
+        # resolution are paid once instead of per package
+        names = [pkg['name'] for pkg in outdated]
+        run_with_progress([*pip, 'install', '--upgrade', *names], "Updating packages")
 
         print_success(f"Updated {len(outdated)} packages")
         logging.info(f"Updated {len(outdated)} packages in {venv_name}")
 
+    except subprocess.CalledProcessError as e:
+        print_error("Failed to update packages")
+        print(f"{YELLOW}{e.output}{RESET}")
+        logging.error(f"Failed to update packages in {venv_name}: {e}")
     except Exception as e:
         print_error(f"Failed to update packages: {e}")
         logging.error(f"Failed to update packages in {venv_name}: {e}")
@@ -854,27 +1013,16 @@ def search_packages(venv_name):
         return
 
     try:
-        if IS_WINDOWS:
-            pip = os.path.join(get_venv_path(), venv_name, 'Scripts', 'pip.exe')
-        else:
-            pip = os.path.join(get_venv_path(), venv_name, 'bin', 'pip')
-
         print(f"\n{CYAN}Searching PyPI for '{query}'...{RESET}")
-        show_spinner(2, "Searching")
-
-        # pip search is deprecated, use pip index versions instead or show installed
-        # Let's search in installed packages instead
-        result = subprocess.run(
-            [pip, 'list'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
 
-        matches = []
-        for line in result.stdout.split('\n'):
-            if query.lower() in line.lower():
-                matches.append(line)
+        # pip search is deprecated, so search the installed packages instead,
+        # read straight from site-packages rather than through `pip list`
+        if not os.path.isdir(os.path.join(get_venv_path(), venv_name)):
+            raise FileNotFoundError(f"virtual environment '{venv_name}' not found")
+
+        # Case-insensitive match compiled once, instead of lowercasing every line
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        matches = [line for line in package_table(venv_name) if pattern.search(line)]
 
         if matches:
             print(f"\n{GREEN}Found {len(matches)} matching installed packages:{RESET}")
@@ -889,87 +1037,101 @@ def search_packages(venv_name):
     except Exception as e:
         print_error(f"Search failed: {e}")
 
+# Settings screen options, the part of the screen that never changes
+_SETTINGS_OPTIONS = (
+    f"\n{YELLOW}Options:{RESET}\n"
+    f"{GREEN}1. Change venv location (current/custom){RESET}\n"
+    f"{GREEN}2. Set custom venv path{RESET}\n"
+    f"{GREEN}3. Toggle auto-activation{RESET}\n"
+    f"{GREEN}4. Toggle animations{RESET}\n"
+    f"{GREEN}5. Toggle deletion confirmation{RESET}\n"
+    f"{GREEN}6. Save and return{RESET}"
+)
+
 def show_settings():
     """Display and modify settings."""
+    dirty = False  # Only write the config file if something changed
     while True:
         print_header()
-        print(f"{SECTION_HEADER} Current Settings {RESET}\n")
-        
-        for key, value in config.items():
-            print(f"{BLUE}{key}: {WHITE}{value}{RESET}")
-        
-        print(f"\n{YELLOW}Options:{RESET}")
-        print(f"{GREEN}1. Change venv location (current/custom){RESET}")
-        print(f"{GREEN}2. Set custom venv path{RESET}")
-        print(f"{GREEN}3. Toggle auto-activation{RESET}")
-        print(f"{GREEN}4. Toggle animations{RESET}")
-        print(f"{GREEN}5. Toggle deletion confirmation{RESET}")
-        print(f"{GREEN}6. Save and return{RESET}")
+        lines = [f"{SECTION_HEADER} Current Settings {RESET}\n"]
+        lines += [f"{BLUE}{key}: {WHITE}{value}{RESET}" for key, value in config.items()]
+        lines.append(_SETTINGS_OPTIONS)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         choice = input(f"\n{YELLOW}Enter choice: {RESET}")
         
         if choice == '1':
             loc = input(f"{YELLOW}Enter location type (current/custom): {RESET}")
             if loc in ['current', 'custom']:
+                dirty |= config['venv_location'] != loc
                 config['venv_location'] = loc
         elif choice == '2':
             path = input(f"{YELLOW}Enter custom venv path: {RESET}")
+            dirty |= config['custom_venv_path'] != path
             config['custom_venv_path'] = path
         elif choice == '3':
             config['auto_activate'] = not config['auto_activate']
+            dirty = True
         elif choice == '4':
             config['show_animations'] = not config['show_animations']
+            dirty = True
         elif choice == '5':
             config['confirm_deletions'] = not config['confirm_deletions']
+            dirty = True
         elif choice == '6':
-            save_config(config)
+            if dirty:
+                save_config(config)
             break
 
-def show_help():
-    """Display help information."""
-    print_header()
-    print(f"{SECTION_HEADER} Available Commands {RESET}\n")
-    
-    help_sections = [
-        ("Environment Management", [
-            ("Create", "Create a new virtual environment"),
-            ("Activate", "Show activation instructions"),
-            ("Deactivate", "Show deactivation instructions"),
-            ("Delete", "Remove a virtual environment"),
-            ("List", "Show all virtual environments")
-        ]),
-        ("Package Management", [
-            ("Install", "Install a new package"),
-            ("List Packages", "Show installed packages"),
-            ("Export", "Save requirements.txt"),
-            ("Upgrade Pip", "Update pip to latest version")
-        ]),
-        ("Settings", [
-            ("Location", "Change where venvs are stored"),
-            ("Auto-activate", "Toggle automatic activation"),
-            ("Confirm Delete", "Toggle deletion confirmation")
-        ])
-    ]
-    
-    for section, items in help_sections:
-        print(f"{PURPLE}{section}:{RESET}")
+# Help screen sections: (title, [(command, description), ...])
+HELP_SECTIONS = (
+    ("Environment Management", [
+        ("Create", "Create a new virtual environment"),
+        ("Activate", "Show activation instructions"),
+        ("Deactivate", "Show deactivation instructions"),
+        ("Delete", "Remove a virtual environment"),
+        ("List", "Show all virtual environments")
+    ]),
+    ("Package Management", [
+        ("Install", "Install a new package"),
+        ("List Packages", "Show installed packages"),
+        ("Export", "Save requirements.txt"),
+        ("Upgrade Pip", "Update pip to latest version")
+    ]),
+    ("Settings", [
+        ("Location", "Change where venvs are stored"),
+        ("Auto-activate", "Toggle automatic activation"),
+        ("Confirm Delete", "Toggle deletion confirmation")
+    ])
+)
+
+def _build_help_text():
+    """Assemble the colored help screen once; the sections never change."""
+    lines = [f"{SECTION_HEADER} Available Commands {RESET}\n"]
+    for section, items in HELP_SECTIONS:
+        lines.append(f"{PURPLE}{section}:{RESET}")
         for cmd, desc in items:
-            print(f"{BLUE}{cmd:15}{RESET} - {WHITE}{desc}{RESET}")
-        print()
-    
+            lines.append(f"{BLUE}{cmd:15}{RESET} - {WHITE}{desc}{RESET}")
+        lines.append("")
     if IS_WINDOWS:
-        print(f"\n{YELLOW}Note: On Windows, use 'activate.bat' to activate environments{RESET}")
+        lines.append(f"\n{YELLOW}Note: On Windows, use 'activate.bat' to activate environments{RESET}")
     else:
-        print(f"\n{YELLOW}Note: Use 'source bin/activate' to activate environments{RESET}")
+        lines.append(f"\n{YELLOW}Note: Use 'source bin/activate' to activate environments{RESET}")
+    return "\n".join(lines) + "\n"
+
+_HELP_TEXT = _build_help_text()
+
+def show_help():
+    """Display help information."""
+    print_header()
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
     
     input(f"\n{YELLOW}Press Enter to continue...{RESET}")
 
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Python Virtual Environment Manager v2.3 - A powerful tool for managing Python venvs",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Help text shown after the option list by --help
+EPILOG = """
 ================================================================================
                     PYTHON VIRTUAL ENVIRONMENT MANAGER v2.3
 ================================================================================
@@ -1091,7 +1253,14 @@ TIPS:
   * Switch to conda_setup (option 14) for Conda management
 
 ================================================================================
-        """
+"""
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Python Virtual Environment Manager v2.3 - A powerful tool for managing Python venvs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
 
     # Environment Management
@@ -1149,137 +1318,125 @@ def rainbow_bunny():
     print(f"\n{MAGENTA}🐰 Bunny says: 'Virtual environments are virtually awesome!' 🐰{RESET}")
     print(f"{CYAN}   Easter egg found! Rangers lead the way!{RESET}\n")
 
+def _deactivation_prompt(venv_name):
+    """Menu wrapper: deactivation is the same for every venv."""
+    show_deactivation_instructions()
+
+# Menu options that act on one existing venv, chosen by its number
+VENV_MENU_ACTIONS = {
+    '2': show_activation_instructions,
+    '3': _deactivation_prompt,
+    '4': delete_venv,
+    '5': show_venv_info,
+    '6': list_packages,
+    '7': install_package,
+    '8': install_requirements,
+    '9': uninstall_package,
+    '10': update_all_packages,
+    '11': search_packages,
+    '12': export_requirements,
+    '13': upgrade_pip,
+}
+
+def prompt_for_venv(existing_venvs):
+    """Ask for a venv by its menu number and return its name, or None if invalid."""
+    venv_num = input(f"{YELLOW}Enter environment number: {RESET}").strip()
+    if venv_num.isdigit() and 1 <= int(venv_num) <= len(existing_venvs):
+        return existing_venvs[int(venv_num) - 1]
+    print_warning("Invalid environment number")
+    return None
+
+# Main menu sections; options are numbered in this order
+MENU_ITEMS = (
+    ("Environment", [
+        "Create new virtual environment",
+        "Activate environment",
+        "Deactivate environment",
+        "Delete environment",
+        "Show venv info (size, packages, version)"
+    ]),
+    ("Packages", [
+        "List installed packages",
+        "Install package",
+        "Install from requirements.txt",
+        "Uninstall package",
+        "Update all packages",
+        "Search packages",
+        "Export requirements.txt",
+        "Upgrade pip"
+    ]),
+    ("Additional Tools", [
+        "Switch to Conda Environment Manager"
+    ]),
+    ("System", [
+        "Settings",
+        "Help"
+    ])
+)
+
+def _build_menu_body():
+    """Number and color the menu options once; they never change between renders."""
+    lines = [f"\n{SECTION_HEADER} Menu Options {RESET}"]
+    current_index = 1
+    for section, items in MENU_ITEMS:
+        lines.append(f"\n{PURPLE}{section}:{RESET}")
+        for item in items:
+            lines.append(_MENU_FMT(current_index, item))
+            current_index += 1
+    lines.append(f"\n{RED}0. Exit{RESET}")
+    return "\n".join(lines)
+
+_MENU_BODY = _build_menu_body()
+
+# Options that can add or remove venvs (create, delete, settings may move the
+# venv location); the directories are only rescanned after one of these
+VENV_LIST_CHOICES = frozenset(('1', '4', '15'))
+
 def main_menu():
     """Main program menu."""
+    rescan = True
     while True:
-        existing_venvs = check_existing_venvs()
-        local_venvs = detect_local_venv()
+        if rescan:
+            existing_venvs = check_existing_venvs()
+            local_venvs = detect_local_venv()
+        venv_meta = gather_venv_meta(list(dict.fromkeys(local_venvs + existing_venvs)))
         print_header()
 
         # Show local venv detection
+        lines = []
         if local_venvs:
-            print(f"{HIGHLIGHT} 📁 Local venv detected in current directory! {RESET}")
+            lines.append(f"{HIGHLIGHT} 📁 Local venv detected in current directory! {RESET}")
             for venv in local_venvs:
-                pkg_count = count_packages(venv)
-                py_ver = get_venv_python_version(venv)
-                print(f"   {GREEN}→ {venv}{RESET} ({CYAN}Python {py_ver}{RESET}, {YELLOW}{pkg_count} packages{RESET})")
-            print()
+                pkg_count, py_ver = venv_meta[venv]
+                lines.append(_LOCAL_VENV_FMT(venv, py_ver, pkg_count))
+            lines.append("")
 
         if existing_venvs:
-            print(f"{SECTION_HEADER} Available Virtual Environments {RESET}")
+            lines.append(f"{SECTION_HEADER} Available Virtual Environments {RESET}")
             for i, venv in enumerate(existing_venvs, 1):
-                pkg_count = count_packages(venv)
-                print(f"{GREEN}{i}. {venv}{RESET} ({GRAY}{pkg_count} packages{RESET})")
+                lines.append(_VENV_FMT(i, venv, venv_meta[venv][0]))
         else:
-            print(f"{YELLOW}No virtual environments found{RESET}")
-
-        print(f"\n{SECTION_HEADER} Menu Options {RESET}")
-        menu_items = [
-            ("Environment", [
-                "Create new virtual environment",
-                "Activate environment",
-                "Deactivate environment",
-                "Delete environment",
-                "Show venv info (size, packages, version)"
-            ]),
-            ("Packages", [
-                "List installed packages",
-                "Install package",
-                "Install from requirements.txt",
-                "Uninstall package",
-                "Update all packages",
-                "Search packages",
-                "Export requirements.txt",
-                "Upgrade pip"
-            ]),
-            ("Additional Tools", [
-                "Switch to Conda Environment Manager"
-            ]),
-            ("System", [
-                "Settings",
-                "Help"
-            ])
-        ]
-        
-        # Update menu color display
-        current_index = 1
-        for section, items in menu_items:
-            print(f"\n{PURPLE}{section}:{RESET}")
-            for item in items:
-                print(f"{GREEN}{current_index}. {WHITE}{item}{RESET}")
-                current_index += 1
-        
-        print(f"\n{RED}0. Exit{RESET}")
-        
-        valid_choices = [str(i) for i in range(current_index)] + ['0']
+            lines.append(f"{YELLOW}No virtual environments found{RESET}")
+
+        lines.append(_MENU_BODY)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         choice = input(f"\n{GREEN}Enter your choice: {RESET}")
+        rescan = choice in VENV_LIST_CHOICES
         
         if choice == '0':
             if input(f"{YELLOW}Are you sure you want to exit? (y/n): {RESET}").lower().startswith('y'):
                 print_success("Goodbye!")
                 logging.info("Program terminated normally")
-                show_spinner(1, "Exiting")
                 return 'exit'
-
-        # Environment section (1-5)
         elif choice == '1':
             create_venv()
-        elif choice == '2' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                show_activation_instructions(existing_venvs[venv_num-1])
-        elif choice == '3' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                show_deactivation_instructions()
-        elif choice == '4' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                delete_venv(existing_venvs[venv_num-1])
-        elif choice == '5' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                show_venv_info(existing_venvs[venv_num-1])
-
-        # Packages section (6-13)
-        elif choice == '6' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                list_packages(existing_venvs[venv_num-1])
-        elif choice == '7' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                install_package(existing_venvs[venv_num-1])
-        elif choice == '8' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                install_requirements(existing_venvs[venv_num-1])
-        elif choice == '9' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                uninstall_package(existing_venvs[venv_num-1])
-        elif choice == '10' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                update_all_packages(existing_venvs[venv_num-1])
-        elif choice == '11' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                search_packages(existing_venvs[venv_num-1])
-        elif choice == '12' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                export_requirements(existing_venvs[venv_num-1])
-        elif choice == '13' and existing_venvs:
-            venv_num = int(input(f"{YELLOW}Enter environment number: {RESET}"))
-            if 1 <= venv_num <= len(existing_venvs):
-                upgrade_pip(existing_venvs[venv_num-1])
-
-        # Additional Tools (14)
-        elif choice == '14':
+        elif choice in VENV_MENU_ACTIONS and existing_venvs:  # Options acting on one venv
+            venv_name = prompt_for_venv(existing_venvs)
+            if venv_name:
+                VENV_MENU_ACTIONS[choice](venv_name)
+        elif choice == '14':  # Additional Tools
             return 'switch_to_conda'
-
-        # System section (15-16)
         elif choice == '15':
             show_settings()
         elif choice == '16':
@@ -1292,10 +1449,6 @@ def main():
     """Main entry point."""
     args = parse_args()
 
-    # Handle color disable
-    if args.no_color:
-        init(strip=True)
-
     # Easter egg check first (no requirements needed)
     if args.bunny:
         rainbow_bunny()
@@ -1313,19 +1466,19 @@ def main():
         elif args.list:
             venvs = check_existing_venvs()
             if venvs:
+                venv_meta = gather_venv_meta(venvs)
                 print(f"{MENU_HEADER} Available Environments {RESET}")
                 for i, env in enumerate(venvs, 1):
-                    pkg_count = count_packages(env)
-                    print(f"{GREEN}{i}. {env}{RESET} ({GRAY}{pkg_count} packages{RESET})")
+                    print(_VENV_FMT(i, env, venv_meta[env][0]))
             else:
                 print(f"{YELLOW}No environments found{RESET}")
         elif args.detect:
             local_venvs = detect_local_venv()
             if local_venvs:
+                venv_meta = gather_venv_meta(local_venvs)
                 print(f"{GREEN}📁 Found venv in current directory:{RESET}")
                 for venv in local_venvs:
-                    pkg_count = count_packages(venv)
-                    py_ver = get_venv_python_version(venv)
+                    pkg_count, py_ver = venv_meta[venv]
                     size = get_venv_size(os.path.join(os.getcwd(), venv))
                     print(f"   {CYAN}→ {venv}{RESET}")
                     print(f"     Python: {py_ver}")
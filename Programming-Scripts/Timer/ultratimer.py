@@ -8,21 +8,31 @@ Works on: MacOS (M1/M2/M3), Windows, Linux
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
+import math
 import time
 from datetime import datetime, timedelta
 import threading
 import platform
 import os
 from pathlib import Path
-import pygame  # For sound effects
 from dataclasses import dataclass
 from typing import Dict, List, Optional
-import webbrowser
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import HTTPServer, BaseHTTPRequestHandler
 import socket
 
-# Initialize pygame for sound
-pygame.mixer.init()
+
+# The remote control has no authentication, so it only listens on this machine
+# unless ULTRATIMER_REMOTE_HOST opts in to more (e.g. 0.0.0.0 for the whole LAN)
+REMOTE_HOST = os.environ.get("ULTRATIMER_REMOTE_HOST", "127.0.0.1")
+
+# Stats changes are batched and written this long after the first one
+STATS_FLUSH_DELAY_MS = 5000
+
+# Built-in system sound used for any effect without its own sound file
+SYSTEM_SOUNDS = {
+    "Darwin": "/System/Library/Sounds/Glass.aiff",
+    "Linux": "/usr/share/sounds/freedesktop/stereo/complete.oga",
+}
 
 @dataclass
 class TimerPreset:
@@ -34,6 +44,108 @@ class TimerPreset:
     sound_enabled: bool = True
     color_theme: str = "default"
 
+# Page served by the remote control web server
+REMOTE_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>UltraTimer Remote</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            background: #1a1a2e;
+            color: #eee;
+            text-align: center;
+            padding: 20px;
+        }
+        button {
+            background: #16f4d0;
+            color: #1a1a2e;
+            border: none;
+            padding: 15px 30px;
+            margin: 10px;
+            font-size: 18px;
+            border-radius: 5px;
+            cursor: pointer;
+        }
+        button:hover {
+            background: #13c4a8;
+        }
+        h1 {
+            color: #16f4d0;
+        }
+        .time-display {
+            font-size: 48px;
+            font-weight: bold;
+            margin: 20px;
+        }
+    </style>
+</head>
+<body>
+    <h1>UltraTimer Remote Control</h1>
+    <div class="time-display" id="time">00:00</div>
+    <div>
+        <button onclick="sendCommand('start')">Start/Pause</button>
+        <button onclick="sendCommand('reset')">Reset</button>
+    </div>
+    <div>
+        <button onclick="sendCommand('1min')">1 Min</button>
+        <button onclick="sendCommand('5min')">5 Min</button>
+        <button onclick="sendCommand('10min')">10 Min</button>
+    </div>
+    <script>
+        function sendCommand(cmd) {
+            fetch('/command/' + cmd);
+        }
+        setInterval(() => {
+            fetch('/status').then(r => r.json()).then(data => {
+                document.getElementById('time').innerText = data.time;
+            });
+        }, 1000);
+    </script>
+</body>
+</html>
+"""
+
+# Remote control commands: /command/<name> -> action run on the Tk main loop
+REMOTE_COMMANDS = {
+    "start": lambda app: app.toggle_timer(),
+    "reset": lambda app: app.reset_timer(),
+    "1min": lambda app: app.set_duration(60),
+    "5min": lambda app: app.set_duration(300),
+    "10min": lambda app: app.set_duration(600),
+}
+
+class RemoteControlHandler(BaseHTTPRequestHandler):
+    """Serve the remote control page plus its /status and /command/* endpoints"""
+    app = None  # The UltraTimer being controlled, set per server
+    html = REMOTE_HTML.encode()
+    
+    def do_GET(self):
+        if self.path == "/":
+            self.send_body(self.html, "text/html; charset=utf-8")
+        elif self.path == "/status":
+            status = json.dumps({"time": self.app.display_text()})
+            self.send_body(status.encode(), "application/json")
+        elif self.path.startswith("/command/") and self.path[9:] in REMOTE_COMMANDS:
+            # Tk is not thread-safe, so hand the action to its main loop
+            self.app.root.after(0, REMOTE_COMMANDS[self.path[9:]], self.app)
+            self.send_body(b"OK", "text/plain")
+        else:
+            self.send_error(404)
+            
+    def send_body(self, body, content_type):
+        """Send a 200 response with the given body"""
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        
+    def log_message(self, format, *args):
+        pass  # Keep the terminal quiet; the page polls /status every second
+
 class UltraTimer:
     def __init__(self):
         self.root = tk.Tk()
@@ -58,10 +170,17 @@ class UltraTimer:
         self.duration = 300  # 5 minutes default
         self.elapsed = 0
         self.remaining = 0
+        self._prev_remaining = 0  # remaining at the previous tick, for threshold crossings
+        self._tick_job = None  # root.after id of the one pending display update
+        self._display_state = {}  # Options last sent to time_display
+        self._last_progress = None
+        self._last_date_ord = None  # Day the clock's date line was last drawn for
         
         # Appearance settings
         self.is_minimal = False
         self.transparency = tk.DoubleVar(value=0.95)
+        self._trans_levels = (0.3, 0.5, 0.7, 0.9, 1.0)
+        self._trans_idx = 3  # 0.95 sits between 0.9 and 1.0, so the first press goes to 1.0
         self.always_on_top = tk.BooleanVar(value=True)
         self.click_through = tk.BooleanVar(value=False)
         
@@ -76,6 +195,8 @@ class UltraTimer:
             "sunset": {"bg": "#832161", "fg": "#ffd23f", "accent": "#ee4266"}
         }
         self.current_theme = "default"
+        self._theme = self.themes[self.current_theme]
+        self._themed_widgets = []  # (widget, {option: theme role}) recolored by change_theme
         
         # Presets storage
         self.presets_file = Path.home() / ".ultratimer_presets.json"
@@ -88,6 +209,8 @@ class UltraTimer:
             "finish": "finish.mp3",
             "tick": "tick.mp3"
         }
+        self.sound_enabled = tk.BooleanVar(value=True)
+        self.loaded_sounds = None  # Filled by ensure_sounds when a countdown starts
         
         # Statistics tracking
         self.stats = {
@@ -97,6 +220,7 @@ class UltraTimer:
             "average_duration": 0
         }
         self.stats_file = Path.home() / ".ultratimer_stats.json"
+        self._stats_dirty = False  # Set when stats changed but are not on disk yet
         self.load_stats()
         
         # Setup UI
@@ -111,13 +235,16 @@ class UltraTimer:
         
     def setup_ui(self):
         """Build the user interface"""
+        t = self._theme
         # Main container
-        self.main_frame = tk.Frame(self.root, bg=self.themes[self.current_theme]["bg"])
+        self.main_frame = tk.Frame(self.root, bg=t["bg"])
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._themed(self.main_frame, bg="bg")
         
         # Top bar with mode selector
-        self.top_bar = tk.Frame(self.main_frame, bg=self.themes[self.current_theme]["bg"])
+        self.top_bar = tk.Frame(self.main_frame, bg=t["bg"])
         self.top_bar.pack(fill=tk.X, pady=(0, 10))
+        self._themed(self.top_bar, bg="bg")
         
         modes = ["Clock", "Timer", "Countdown", "Stopwatch", "Pomodoro"]
         for mode in modes:
@@ -125,36 +252,39 @@ class UltraTimer:
                 self.top_bar,
                 text=mode,
                 command=lambda m=mode.lower(): self.switch_mode(m),
-                bg=self.themes[self.current_theme]["accent"],
-                fg=self.themes[self.current_theme]["bg"],
+                bg=t["accent"],
+                fg=t["bg"],
                 font=("Arial", 10, "bold"),
                 relief=tk.FLAT,
                 padx=10
             )
             btn.pack(side=tk.LEFT, padx=2)
+            self._themed(btn, bg="accent", fg="bg")
         
         # Settings button
         settings_btn = tk.Button(
             self.top_bar,
             text="⚙",
             command=self.open_settings,
-            bg=self.themes[self.current_theme]["bg"],
-            fg=self.themes[self.current_theme]["fg"],
+            bg=t["bg"],
+            fg=t["fg"],
             font=("Arial", 14),
             relief=tk.FLAT
         )
         settings_btn.pack(side=tk.RIGHT)
+        self._themed(settings_btn, bg="bg", fg="fg")
         
         # Main display
-        self.display_frame = tk.Frame(self.main_frame, bg=self.themes[self.current_theme]["bg"])
+        self.display_frame = tk.Frame(self.main_frame, bg=t["bg"])
         self.display_frame.pack(fill=tk.BOTH, expand=True)
+        self._themed(self.display_frame, bg="bg")
         
         self.time_display = tk.Label(
             self.display_frame,
             text="00:00:00",
             font=("Digital-7", 72, "bold"),  # You'll need to install Digital-7 font or use Arial
-            bg=self.themes[self.current_theme]["bg"],
-            fg=self.themes[self.current_theme]["fg"]
+            bg=t["bg"],
+            fg=t["fg"]
         )
         self.time_display.pack(pady=20)
         
@@ -172,44 +302,49 @@ class UltraTimer:
             self.display_frame,
             text="",
             font=("Arial", 14),
-            bg=self.themes[self.current_theme]["bg"],
-            fg=self.themes[self.current_theme]["fg"]
+            bg=t["bg"],
+            fg=t["fg"]
         )
         self.sub_display.pack()
+        self._themed(self.sub_display, bg="bg", fg="fg")
         
         # Control buttons
-        self.control_frame = tk.Frame(self.main_frame, bg=self.themes[self.current_theme]["bg"])
+        self.control_frame = tk.Frame(self.main_frame, bg=t["bg"])
         self.control_frame.pack(fill=tk.X, pady=10)
+        self._themed(self.control_frame, bg="bg")
         
         self.start_btn = tk.Button(
             self.control_frame,
             text="▶ Start",
             command=self.toggle_timer,
-            bg=self.themes[self.current_theme]["accent"],
-            fg=self.themes[self.current_theme]["bg"],
+            bg=t["accent"],
+            fg=t["bg"],
             font=("Arial", 12, "bold"),
             relief=tk.FLAT,
             padx=20,
             pady=5
         )
         self.start_btn.pack(side=tk.LEFT, padx=5)
+        self._themed(self.start_btn, bg="accent", fg="bg")
         
         self.reset_btn = tk.Button(
             self.control_frame,
             text="↺ Reset",
             command=self.reset_timer,
-            bg=self.themes[self.current_theme]["fg"],
-            fg=self.themes[self.current_theme]["bg"],
+            bg=t["fg"],
+            fg=t["bg"],
             font=("Arial", 12, "bold"),
             relief=tk.FLAT,
             padx=20,
             pady=5
         )
         self.reset_btn.pack(side=tk.LEFT, padx=5)
+        self._themed(self.reset_btn, bg="fg", fg="bg")
         
         # Quick time buttons
-        quick_frame = tk.Frame(self.main_frame, bg=self.themes[self.current_theme]["bg"])
+        quick_frame = tk.Frame(self.main_frame, bg=t["bg"])
         quick_frame.pack(fill=tk.X, pady=5)
+        self._themed(quick_frame, bg="bg")
         
         quick_times = [("1m", 60), ("5m", 300), ("10m", 600), ("15m", 900), ("30m", 1800)]
         for label, seconds in quick_times:
@@ -217,25 +352,31 @@ class UltraTimer:
                 quick_frame,
                 text=label,
                 command=lambda s=seconds: self.set_duration(s),
-                bg=self.themes[self.current_theme]["bg"],
-                fg=self.themes[self.current_theme]["accent"],
+                bg=t["bg"],
+                fg=t["accent"],
                 font=("Arial", 10),
                 relief=tk.RAISED,
                 bd=1,
                 padx=8
             )
             btn.pack(side=tk.LEFT, padx=2)
+            self._themed(btn, bg="bg", fg="accent")
         
         # Status bar
         self.status_bar = tk.Label(
             self.main_frame,
             text="Ready",
             font=("Arial", 10),
-            bg=self.themes[self.current_theme]["bg"],
-            fg=self.themes[self.current_theme]["fg"],
+            bg=t["bg"],
+            fg=t["fg"],
             anchor=tk.W
         )
         self.status_bar.pack(fill=tk.X, pady=(5, 0))
+        self._themed(self.status_bar, bg="bg", fg="fg")
+        
+    def _themed(self, widget, **roles):
+        """Register a widget's color options (option -> theme role) for change_theme"""
+        self._themed_widgets.append((widget, roles))
         
     def setup_keyboard_shortcuts(self):
         """Setup global keyboard shortcuts"""
@@ -258,26 +399,13 @@ class UltraTimer:
     def switch_mode(self, mode):
         """Switch between different timer modes"""
         self.mode.set(mode)
+        self._last_date_ord = None  # Other modes reuse sub_display; redraw the date
         self.reset_timer()
         self.status_bar.config(text=f"Mode: {mode.capitalize()}")
         
-        if mode == "clock":
-            self.show_clock()
-        elif mode == "pomodoro":
+        if mode == "pomodoro":
             self.start_pomodoro()
             
-    def show_clock(self):
-        """Display current time and date"""
-        def update_clock():
-            if self.mode.get() == "clock":
-                now = datetime.now()
-                time_str = now.strftime("%H:%M:%S")
-                date_str = now.strftime("%A, %B %d, %Y")
-                self.time_display.config(text=time_str)
-                self.sub_display.config(text=date_str)
-                self.root.after(1000, update_clock)
-        update_clock()
-        
     def start_pomodoro(self):
         """Start Pomodoro timer (25 min work, 5 min break)"""
         self.duration = 1500  # 25 minutes
@@ -286,6 +414,9 @@ class UltraTimer:
     def toggle_timer(self):
         """Start/stop the timer"""
         if self.is_running:
+            if self.mode.get() == "stopwatch":
+                # Ticks only land on whole seconds; keep the fraction since the last one
+                self.elapsed = time.time() - self.start_time
             self.is_running = False
             self.start_btn.config(text="▶ Start")
             self.status_bar.config(text="Paused")
@@ -297,6 +428,11 @@ class UltraTimer:
                 self.start_time = time.time() - self.elapsed
             elif self.mode.get() in ["timer", "countdown", "pomodoro"]:
                 self.start_time = time.time()
+                self._prev_remaining = self.duration
+                if self.loaded_sounds is None and self.sound_enabled.get():
+                    # Load once the button has redrawn, well before the first alert
+                    self.root.after_idle(self.ensure_sounds)
+        self.update_display()  # Reschedule from the new state right away
                 
     def reset_timer(self):
         """Reset the timer"""
@@ -304,7 +440,7 @@ class UltraTimer:
         self.elapsed = 0
         self.remaining = self.duration
         self.start_btn.config(text="▶ Start")
-        self.progress['value'] = 0
+        self._set_progress(0)
         self.update_display()
         self.status_bar.config(text="Reset")
         
@@ -315,58 +451,110 @@ class UltraTimer:
         self.update_display()
         self.status_bar.config(text=f"Duration set to {seconds//60} minutes")
         
+    def _cancel_update(self):
+        """Cancel the pending display update, if any"""
+        if self._tick_job is not None:
+            self.root.after_cancel(self._tick_job)
+            self._tick_job = None
+            
+    def _schedule_update(self, delay_ms):
+        """Arm the single pending display update, replacing any earlier one"""
+        self._cancel_update()
+        self._tick_job = self.root.after(delay_ms, self.update_display)
+        
+    def _set_display(self, **options):
+        """Configure time_display, skipping the Tcl round trip when nothing changed"""
+        changed = {k: v for k, v in options.items() if self._display_state.get(k) != v}
+        if changed:
+            self.time_display.config(**changed)
+            self._display_state.update(changed)
+            
+    def _set_progress(self, value):
+        """Set the progress bar, skipping the Tcl round trip when nothing changed"""
+        if value != self._last_progress:
+            self.progress['value'] = value
+            self._last_progress = value
+            
+    @staticmethod
+    def _format_seconds(total, always_hours=False):
+        """Format seconds as HH:MM:SS, or MM:SS under an hour unless always_hours"""
+        minutes, seconds = divmod(int(total), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours or always_hours:
+            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes:02d}:{seconds:02d}"
+        
+    @staticmethod
+    def _ms_to_next_second(seconds, counting_up=True):
+        """Milliseconds until a running time value next crosses a whole second"""
+        fraction = seconds % 1
+        if counting_up:
+            fraction = 1 - fraction
+        return math.ceil(fraction * 1000) or 1000
+        
     def update_display(self):
         """Update the display based on current mode"""
+        delay_ms = 1000
         if self.mode.get() == "clock":
-            pass  # Clock updates itself
+            # Display current time and date, refreshed on each wall-clock second
+            now = datetime.now()
+            self._set_display(text=now.strftime("%H:%M:%S"))
+            today = now.toordinal()
+            if today != self._last_date_ord:  # The date line only changes at midnight
+                self.sub_display.config(text=now.strftime("%A, %B %d, %Y"))
+                self._last_date_ord = today
+            delay_ms = self._ms_to_next_second(now.timestamp())
         elif self.mode.get() == "stopwatch":
             if self.is_running:
                 self.elapsed = time.time() - self.start_time
-            hours = int(self.elapsed // 3600)
-            minutes = int((self.elapsed % 3600) // 60)
-            seconds = int(self.elapsed % 60)
-            self.time_display.config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+                delay_ms = self._ms_to_next_second(self.elapsed)
+            self._set_display(text=self._format_seconds(self.elapsed, always_hours=True))
             
         elif self.mode.get() in ["timer", "countdown", "pomodoro"]:
             if self.is_running:
                 elapsed = time.time() - self.start_time
+                prev = self._prev_remaining
                 self.remaining = max(0, self.duration - elapsed)
+                self._prev_remaining = self.remaining
                 
                 # Update progress bar
                 progress_percent = ((self.duration - self.remaining) / self.duration) * 100
-                self.progress['value'] = progress_percent
+                self._set_progress(progress_percent)
                 
-                # Change colors based on time remaining
+                # Change colors based on time remaining; the sounds fire on the
+                # tick that crosses a threshold, as remaining is never exactly on it
                 if self.remaining <= 60:
-                    self.time_display.config(fg="#ff0000")  # Red
-                    if self.remaining == 60:
+                    self._set_display(fg="#ff0000")  # Red
+                    if prev > 60 >= self.remaining > 0:
                         self.play_sound("critical")
                 elif self.remaining <= 120:
-                    self.time_display.config(fg="#ffff00")  # Yellow
-                    if self.remaining == 120:
+                    self._set_display(fg="#ffff00")  # Yellow
+                    if prev > 120 >= self.remaining:
                         self.play_sound("warning")
                 else:
-                    self.time_display.config(fg=self.themes[self.current_theme]["fg"])
+                    self._set_display(fg=self._theme["fg"])
                 
                 # Check if timer finished
-                if self.remaining == 0:
+                if prev > 0 >= self.remaining:
                     self.is_running = False
                     self.play_sound("finish")
                     self.show_notification("Timer Finished!")
                     self.stats["completed_timers"] += 1
                     self.save_stats()
+                else:
+                    # The 120/60/0 s thresholds are whole seconds too, so the
+                    # next second boundary is also the next possible color change
+                    delay_ms = self._ms_to_next_second(self.remaining, counting_up=False)
                     
-            hours = int(self.remaining // 3600)
-            minutes = int((self.remaining % 3600) // 60)
-            seconds = int(self.remaining % 60)
-            
-            if hours > 0:
-                self.time_display.config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-            else:
-                self.time_display.config(text=f"{minutes:02d}:{seconds:02d}")
+            self._set_display(text=self._format_seconds(self.remaining))
         
-        # Schedule next update
-        self.root.after(100, self.update_display)  # Update every 100ms for smooth display
+        # Schedule the next update for when the shown time next changes. Nothing
+        # changes while paused, so no update is scheduled until toggle_timer
+        # (or a reset/duration change) calls update_display again
+        if self.is_running or self.mode.get() == "clock":
+            self._schedule_update(delay_ms)
+        else:
+            self._cancel_update()
         
     def toggle_minimal(self):
         """Toggle between minimal and full view"""
@@ -383,13 +571,10 @@ class UltraTimer:
             
     def toggle_transparency(self):
         """Cycle through transparency levels"""
-        current = self.transparency.get()
-        levels = [0.3, 0.5, 0.7, 0.9, 1.0]
-        next_level = levels[(levels.index(min(levels, key=lambda x: abs(x - current))) + 1) % len(levels)]
-        self.transparency.set(next_level)
-        
-        if platform.system() == "Windows" or platform.system() == "Linux":
-            self.root.attributes('-alpha', next_level)
+        self._trans_idx = (self._trans_idx + 1) % len(self._trans_levels)
+        level = self._trans_levels[self._trans_idx]
+        self.transparency.set(level)
+        self.root.attributes('-alpha', level)  # Supported by Tk on macOS too
         
     def open_settings(self):
         """Open settings window"""
@@ -410,7 +595,6 @@ class UltraTimer:
             btn.pack(pady=2)
         
         # Sound toggle
-        self.sound_enabled = tk.BooleanVar(value=True)
         tk.Checkbutton(
             settings_window,
             text="Enable Sounds",
@@ -473,34 +657,61 @@ class UltraTimer:
     def change_theme(self, theme_name):
         """Change the color theme"""
         self.current_theme = theme_name
-        theme = self.themes[theme_name]
+        self._theme = theme = self.themes[theme_name]
         
         # Update all widgets with new colors
-        self.main_frame.config(bg=theme["bg"])
-        self.top_bar.config(bg=theme["bg"])
-        self.display_frame.config(bg=theme["bg"])
-        self.control_frame.config(bg=theme["bg"])
-        self.time_display.config(bg=theme["bg"], fg=theme["fg"])
-        self.sub_display.config(bg=theme["bg"], fg=theme["fg"])
-        self.status_bar.config(bg=theme["bg"], fg=theme["fg"])
+        for widget, roles in self._themed_widgets:
+            widget.config(**{option: theme[role] for option, role in roles.items()})
+        self._set_display(bg=theme["bg"], fg=theme["fg"])
         
     def toggle_always_on_top(self):
         """Toggle always on top window attribute"""
         self.root.attributes('-topmost', self.always_on_top.get())
         
+    def load_sounds(self):
+        """Start the mixer and preload sound effects so playing one starts at once"""
+        try:
+            import pygame  # Only pulled in once a sound is actually played
+        except ImportError:
+            return {}
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            return {}  # No audio device
+            
+        fallback = SYSTEM_SOUNDS.get(platform.system())
+        by_path = {}
+        loaded = {}
+        for sound_type, filename in self.sounds.items():
+            for path in (filename, fallback):
+                if not path or not os.path.exists(path):
+                    continue
+                try:
+                    if path not in by_path:
+                        by_path[path] = pygame.mixer.Sound(path)
+                    loaded[sound_type] = by_path[path]
+                    break
+                except pygame.error:
+                    continue  # Format the mixer can't read; try the fallback
+        return loaded
+        
+    def ensure_sounds(self):
+        """Load the sound effects if that hasn't happened yet"""
+        if self.loaded_sounds is None:
+            self.loaded_sounds = self.load_sounds()
+            
     def play_sound(self, sound_type):
         """Play a sound effect"""
         if not self.sound_enabled.get():
             return
             
-        # For now, use system beep. You can add actual sound files
-        if platform.system() == "Darwin":  # macOS
-            os.system("afplay /System/Library/Sounds/Glass.aiff")
+        self.ensure_sounds()  # Normally done already when the countdown started
+        sound = self.loaded_sounds.get(sound_type)
+        if sound:
+            sound.play()  # Returns immediately; the mixer plays it in the background
         elif platform.system() == "Windows":
             import winsound
             winsound.Beep(1000, 200)
-        else:  # Linux
-            os.system("paplay /usr/share/sounds/freedesktop/stereo/complete.oga")
             
     def show_notification(self, message):
         """Show system notification"""
@@ -556,14 +767,20 @@ class UltraTimer:
         self.update_display()
         self.status_bar.config(text=f"Loaded preset: {preset.name}")
         
+    @staticmethod
+    def write_json(path, data):
+        """Write data as JSON via a temp file, so a crash never leaves half a file"""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, path)
+        
     def save_presets(self):
         """Save presets to file"""
-        with open(self.presets_file, 'w') as f:
-            json.dump(
-                {name: vars(preset) for name, preset in self.presets.items()},
-                f,
-                indent=2
-            )
+        self.write_json(
+            self.presets_file,
+            {name: vars(preset) for name, preset in self.presets.items()}
+        )
             
     def load_presets(self):
         """Load presets from file"""
@@ -577,9 +794,16 @@ class UltraTimer:
         return {}
         
     def save_stats(self):
-        """Save statistics to file"""
-        with open(self.stats_file, 'w') as f:
-            json.dump(self.stats, f, indent=2)
+        """Mark statistics changed; one write follows shortly for all changes made meanwhile"""
+        if not self._stats_dirty:
+            self._stats_dirty = True
+            self.root.after(STATS_FLUSH_DELAY_MS, self.flush_stats)
+            
+    def flush_stats(self):
+        """Write statistics to file if they changed"""
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self.write_json(self.stats_file, self.stats)
             
     def load_stats(self):
         """Load statistics from file"""
@@ -600,8 +824,7 @@ class UltraTimer:
                 "theme": self.current_theme,
                 "sound_enabled": self.sound_enabled.get()
             }
-            with open(filename, 'w') as f:
-                json.dump(settings, f, indent=2)
+            self.write_json(filename, settings)
             self.status_bar.config(text=f"Settings exported to {filename}")
             
     def import_settings(self):
@@ -626,96 +849,30 @@ class UltraTimer:
             self.save_stats()
             self.status_bar.config(text="Settings imported successfully")
             
+    def display_text(self):
+        """Text currently shown on the main time display"""
+        return self._display_state.get("text", "")
+        
     def start_web_server(self):
         """Start web server for remote control"""
         def run_server():
             try:
-                # Create simple HTML remote control
-                html_content = """
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>UltraTimer Remote</title>
-                    <meta name="viewport" content="width=device-width, initial-scale=1">
-                    <style>
-                        body {
-                            font-family: Arial, sans-serif;
-                            background: #1a1a2e;
-                            color: #eee;
-                            text-align: center;
-                            padding: 20px;
-                        }
-                        button {
-                            background: #16f4d0;
-                            color: #1a1a2e;
-                            border: none;
-                            padding: 15px 30px;
-                            margin: 10px;
-                            font-size: 18px;
-                            border-radius: 5px;
-                            cursor: pointer;
-                        }
-                        button:hover {
-                            background: #13c4a8;
-                        }
-                        h1 {
-                            color: #16f4d0;
-                        }
-                        .time-display {
-                            font-size: 48px;
-                            font-weight: bold;
-                            margin: 20px;
-                        }
-                    </style>
-                </head>
-                <body>
-                    <h1>UltraTimer Remote Control</h1>
-                    <div class="time-display" id="time">00:00</div>
-                    <div>
-                        <button onclick="sendCommand('start')">Start/Pause</button>
-                        <button onclick="sendCommand('reset')">Reset</button>
-                    </div>
-                    <div>
-                        <button onclick="sendCommand('1min')">1 Min</button>
-                        <button onclick="sendCommand('5min')">5 Min</button>
-                        <button onclick="sendCommand('10min')">10 Min</button>
-                    </div>
-                    <script>
-                        function sendCommand(cmd) {
-                            fetch('/command/' + cmd);
-                        }
-                        setInterval(() => {
-                            fetch('/status').then(r => r.json()).then(data => {
-                                document.getElementById('time').innerText = data.time;
-                            });
-                        }, 1000);
-                    </script>
-                </body>
-                </html>
-                """
-                
-                # Find available port
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.bind(('', 0))
-                port = sock.getsockname()[1]
-                sock.close()
-                
-                # Save HTML to temp file
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-                    f.write(html_content)
-                    temp_html = f.name
+                # Port 0 lets the OS pick a free port when binding, with no
+                # window for another process to take it first
+                handler = type("Handler", (RemoteControlHandler,), {"app": self})
+                server = HTTPServer((REMOTE_HOST, 0), handler)
+                host, port = server.server_address[:2]
                 
-                # Simple HTTP server
-                server = HTTPServer(('0.0.0.0', port), SimpleHTTPRequestHandler)
+                if not host.startswith("127."):
+                    host = socket.gethostbyname(socket.gethostname())
+                    print(f"Warning: remote control at http://{host}:{port} accepts "
+                          "commands from anyone on the network, without a password")
                 
-                # Show URL in status bar
-                hostname = socket.gethostname()
-                ip = socket.gethostbyname(hostname)
-                self.status_bar.config(text=f"Remote: http://{ip}:{port}")
+                # Show URL in status bar; Tk is not thread-safe, so via its main loop
+                url = f"http://{host}:{port}"
+                self.root.after(0, lambda: self.status_bar.config(text=f"Remote: {url}"))
                 
-                # Note: This is a simplified version. 
-                # For full functionality, you'd need a proper web framework
+                server.serve_forever()
                 
             except Exception as e:
                 print(f"Web server error: {e}")
@@ -727,6 +884,7 @@ class UltraTimer:
     def run(self):
         """Start the application"""
         self.root.mainloop()
+        self.flush_stats()  # Don't lose changes still waiting for their write
 
 if __name__ == "__main__":
     app = UltraTimer()